@@ -0,0 +1,76 @@
+import numpy as np
+
+from claim_behavior import simulate_claim_behavior
+
+
+# Function to sell tokens into a constant-product pool (x * y = k, fee kept in the pool)
+# Returns the new reserves and the quote paid out; works elementwise over any array shape
+def swap_tokens_for_quote(token_reserve, quote_reserve, tokens_in, fee=0.003):
+    effective_in = tokens_in * (1 - fee)
+    quote_out = quote_reserve * effective_in / (token_reserve + effective_in)
+    return token_reserve + tokens_in, quote_reserve - quote_out, quote_out
+
+
+# Function to buy tokens from a constant-product pool with quote currency
+def swap_quote_for_tokens(token_reserve, quote_reserve, quote_in, fee=0.003):
+    effective_in = quote_in * (1 - fee)
+    tokens_out = token_reserve * effective_in / (quote_reserve + effective_in)
+    return token_reserve - tokens_out, quote_reserve + quote_in, tokens_out
+
+
+# Function to push per-period flows through the pool for every path at once
+# sell_flow (tokens), buy_flow (quote) and liquidity_adds (tokens paired at spot) share shape (..., periods);
+# each period adds liquidity, fills buys, then fills sells as one aggregated swap
+def simulate_price_impact(sell_flow, seed_tokens, seed_price, total_supply, buy_flow=None,
+                          liquidity_adds=None, fee=0.003):
+    sell_flow = np.asarray(sell_flow, dtype=float)
+    buy_flow = np.zeros_like(sell_flow) if buy_flow is None else np.asarray(buy_flow, dtype=float)
+    liquidity_adds = np.zeros_like(sell_flow) if liquidity_adds is None else np.asarray(liquidity_adds, dtype=float)
+    sell_flow, buy_flow, liquidity_adds = np.broadcast_arrays(sell_flow, buy_flow, liquidity_adds)
+
+    batch_shape, n_periods = sell_flow.shape[:-1], sell_flow.shape[-1]
+    token_reserve = np.full(batch_shape, float(seed_tokens))
+    quote_reserve = np.full(batch_shape, float(seed_tokens) * seed_price)
+    price = np.empty(sell_flow.shape)
+    slippage = np.zeros(sell_flow.shape)
+    proceeds = np.zeros(sell_flow.shape)
+
+    for t in range(n_periods):
+        spot = quote_reserve / token_reserve
+        token_reserve = token_reserve + liquidity_adds[..., t]
+        quote_reserve = quote_reserve + liquidity_adds[..., t] * spot
+
+        token_reserve, quote_reserve, _ = swap_quote_for_tokens(token_reserve, quote_reserve, buy_flow[..., t], fee)
+
+        spot_before_sell = quote_reserve / token_reserve
+        token_reserve, quote_reserve, quote_out = swap_tokens_for_quote(token_reserve, quote_reserve, sell_flow[..., t], fee)
+        proceeds[..., t] = quote_out
+
+        # Slippage is the execution price shortfall versus the pre-trade spot price
+        selling = sell_flow[..., t] > 0
+        execution_price = np.divide(quote_out, sell_flow[..., t], out=np.zeros(batch_shape), where=selling)
+        slippage[..., t] = np.where(selling, (1 - execution_price / spot_before_sell) * 100, 0)
+        price[..., t] = quote_reserve / token_reserve
+
+    return {
+        "price": price,
+        "fdv": price * total_supply,
+        "slippage": slippage,
+        "proceeds": proceeds,
+        "token_reserve": token_reserve,
+        "quote_reserve": quote_reserve,
+    }
+
+
+# Function to draw organic buy demand (quote per period) as lognormal noise around a mean
+def sample_buy_demand(rng, mean_demand, volatility, shape):
+    sigma = np.sqrt(np.log(1 + volatility ** 2))
+    return mean_demand * rng.lognormal(-sigma ** 2 / 2, sigma, size=shape)
+
+
+# Function to simulate price paths end to end (claim behavior -> sell flow -> pool), shaped for monte_carlo.py
+def simulate_price_paths(rng, n_paths, unlocks, behavior, categories, total_supply, seed_tokens, seed_price,
+                         liquidity_adds, monthly_buy_demand, demand_volatility, fee=0.003):
+    sell_flow = simulate_claim_behavior(rng, unlocks, behavior, categories, total_supply, n_paths)["sold"].sum(axis=-2)
+    buy_flow = sample_buy_demand(rng, monthly_buy_demand, demand_volatility, sell_flow.shape)
+    return simulate_price_impact(sell_flow, seed_tokens, seed_price, total_supply, buy_flow, liquidity_adds, fee)["price"]
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from result_store import DEFAULT_STORE_DIR, code_version, evict_results, load_result, save_result, store_key
+from supply_engine import calculate_unlock_matrix, calculate_shock_series
+
+# Batch mode: every *.json file in a directory is one project config with the same blocks as the dashboard
+# (allocations, vesting_schedule, investor_rounds, private_sale_tiers, total_supply). Configs are evaluated
+# through the supply engine at one common horizon and reduced to a leaderboard.
+#
+#   python batch.py configs/ --months 48 --output leaderboard.csv
+
+
+# Function to load every JSON config in a directory, keyed by file name without extension
+def load_configs(config_dir):
+    configs = {}
+    for file_name in sorted(os.listdir(config_dir)):
+        if file_name.endswith(".json"):
+            with open(os.path.join(config_dir, file_name)) as f:
+                configs[os.path.splitext(file_name)[0]] = json.load(f)
+    return configs
+
+
+# Function to evaluate one config into its monthly unlock totals (tokens), run inside worker processes
+def evaluate_config(config, months):
+    unlocks = calculate_unlock_matrix(
+        config["allocations"],
+        config["vesting_schedule"],
+        config.get("private_sale_tiers"),
+        months
+    )
+    return unlocks.sum(axis=0)
+
+
+# Function to evaluate configs across a process pool, reusing stored results for unchanged configs
+# Results are keyed by config content (keys sorted, so reformatting a file does not invalidate them),
+# horizon and the source of the engine modules; returns a configs x periods array of monthly unlock totals (tokens)
+def evaluate_configs(configs, months=48, n_workers=None, store_dir=DEFAULT_STORE_DIR):
+    names = list(configs)
+    totals = np.zeros((len(names), months + 1))
+    code = code_version(evaluate_config)
+    pending = []
+    for i, name in enumerate(names):
+        key = store_key("batch_config", {"config": configs[name], "months": months}, code) if store_dir else None
+        stored = load_result(key, store_dir) if key else None
+        if stored is not None:
+            totals[i] = stored["unlock_totals"]
+        else:
+            pending.append((i, key))
+
+    if pending:
+        with ProcessPoolExecutor(n_workers) as pool:
+            results = pool.map(
+                evaluate_config,
+                [configs[names[i]] for i, _ in pending],
+                [months] * len(pending),
+                chunksize=max(1, len(pending) // (4 * (n_workers or os.cpu_count() or 1)))
+            )
+            for (i, key), result in zip(pending, results):
+                totals[i] = result
+                if key:
+                    save_result(key, {"unlock_totals": result}, store_dir, max_bytes=None)
+        if store_dir:
+            evict_results(store_dir)
+    return totals
+
+
+# Function to reduce evaluated configs to one leaderboard row each, lowest worst-month shock first
+# totals must cover at least 48 months
+def build_leaderboard(configs, totals):
+    total_supplies = np.array([config.get("total_supply", sum(config["allocations"].values())) for config in configs.values()])
+    # All configs share the horizon, so supply and shocks are computed for the whole batch at once
+    supply = np.cumsum(totals, axis=1) / total_supplies[:, None] * 100
+    shocks = calculate_shock_series(supply)
+
+    leaderboard = pd.DataFrame({
+        "Project": list(configs),
+        "TGE Float (%)": supply[:, 0],
+        "Max Shock (%)": shocks[:, 1:].max(axis=1),
+        "Max Shock Month": shocks[:, 1:].argmax(axis=1) + 1,
+        "Month 12 Circulating (%)": supply[:, 12],
+        "Month 48 Circulating (%)": supply[:, 48],
+        "Total Raise ($)": [sum(r["amount_raised"] for r in config.get("investor_rounds", {}).values()) for config in configs.values()],
+        "FDV ($)": [
+            max((r.get("fdv", r["price_per_token"] * supply_tokens) for r in config.get("investor_rounds", {}).values()), default=0)
+            for config, supply_tokens in zip(configs.values(), total_supplies)
+        ]
+    })
+    return leaderboard.sort_values("Max Shock (%)").reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate a directory of tokenomics configs into a leaderboard")
+    parser.add_argument("config_dir", help="directory of *.json project configs")
+    parser.add_argument("--months", type=int, default=48, help="common horizon in months (default 48)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--store-dir", default=DEFAULT_STORE_DIR, help="shared result store ('' to disable)")
+    parser.add_argument("--output", help="write the leaderboard to this CSV file")
+    args = parser.parse_args()
+    if args.months < 48:
+        parser.error("--months must be at least 48 to report Month 48 circulating supply")
+
+    configs = load_configs(args.config_dir)
+    totals = evaluate_configs(configs, args.months, args.workers, args.store_dir or None)
+    leaderboard = build_leaderboard(configs, totals)
+    if args.output:
+        leaderboard.to_csv(args.output, index=False)
+    with pd.option_context("display.max_rows", None, "display.width", 200, "display.float_format", "{:,.2f}".format):
+        print(leaderboard.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import numpy as np
+
+from supply_engine import calculate_cumulative_supply, calculate_shock_series
+
+
+# Function to build geometric lag distributions (months) from mean delays
+# mean_delay can have any shape (e.g. paths x categories); the lag axis is appended last
+def geometric_lag_pmf(mean_delay, max_lag=36):
+    mean_delay = np.asarray(mean_delay, dtype=float)[..., None]
+    stay = mean_delay / (1 + mean_delay)  # Probability of waiting one more month
+    lags = np.arange(max_lag + 1)
+    pmf = (1 - stay) * stay ** lags
+    # Mass beyond the longest lag is pushed onto it so each distribution sums to one
+    pmf[..., -1] += stay[..., 0] ** (max_lag + 1)
+    return pmf
+
+
+# Function to draw per-path mean delays around the configured means (gamma, coefficient of variation cv)
+def sample_mean_delays(rng, mean_delay, n_paths, cv=0.5):
+    mean_delay = np.asarray(mean_delay, dtype=float)
+    shape = 1 / cv ** 2
+    return rng.gamma(shape, mean_delay / shape, size=(n_paths,) + mean_delay.shape)
+
+
+# Function to convolve flows with lag distributions along the period axis in one batched FFT
+# flows (..., categories, periods) and pmf (..., categories, lags) broadcast against each other;
+# mass delayed past the horizon is dropped, as it has not been realized yet
+def convolve_lags(flows, pmf):
+    flows = np.asarray(flows, dtype=float)
+    n_periods = flows.shape[-1]
+    n_fft = 1 << int(np.ceil(np.log2(n_periods + pmf.shape[-1] - 1)))
+    spectrum = np.fft.rfft(flows, n_fft) * np.fft.rfft(pmf, n_fft)
+    realized = np.fft.irfft(spectrum, n_fft)[..., :n_periods]
+    # Clear FFT round-off so tokens never go negative
+    return np.maximum(realized, 0)
+
+
+# Function to turn unlocked supply into claimed and sold supply
+# claim_pmf / sell_pmf are lag distributions per category, sell_through the share of claims eventually sold
+def apply_claim_behavior(unlocks, claim_pmf, sell_pmf, sell_through, total_supply):
+    claimed = convolve_lags(unlocks, claim_pmf)
+    sold = convolve_lags(claimed, sell_pmf) * np.asarray(sell_through, dtype=float)[..., None]
+
+    realized_supply = calculate_cumulative_supply(claimed, total_supply)
+    liquid_supply = calculate_cumulative_supply(sold, total_supply)
+    return {
+        "claimed": claimed,
+        "sold": sold,
+        "realized_supply": realized_supply,
+        "realized_shocks": calculate_shock_series(realized_supply),
+        "liquid_supply": liquid_supply,
+        "liquid_shocks": calculate_shock_series(liquid_supply),
+    }
+
+
+# Function to run the behavior layer over Monte Carlo paths of sampled claim and sell delays
+def simulate_claim_behavior(rng, unlocks, behavior, categories, total_supply, n_paths=500, cv=0.5, max_lag=36):
+    claim_means = [behavior[category]["claim_delay"] for category in categories]
+    sell_means = [behavior[category]["sell_delay"] for category in categories]
+    sell_through = [behavior[category]["sell_through"] for category in categories]
+
+    claim_pmf = geometric_lag_pmf(sample_mean_delays(rng, claim_means, n_paths, cv), max_lag)
+    sell_pmf = geometric_lag_pmf(sample_mean_delays(rng, sell_means, n_paths, cv), max_lag)
+    return apply_claim_behavior(unlocks, claim_pmf, sell_pmf, sell_through, total_supply)
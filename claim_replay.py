@@ -0,0 +1,217 @@
+import hashlib
+import io
+import json
+import os
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from supply_engine import calculate_cumulative_supply, calculate_shock_series
+
+# Columns every claim log must provide (one row per on-chain claim event)
+CLAIM_COLUMNS = ["wallet", "category", "timestamp", "amount"]
+
+
+# Function to detect the log format from the file extension
+def detect_log_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    return "csv"
+
+
+# Function to parse a block of newline-delimited claim rows into a DataFrame
+def parse_text_block(header, lines, log_format):
+    block = io.BytesIO(header + b"".join(lines))
+    if log_format == "csv":
+        return pd.read_csv(block, usecols=CLAIM_COLUMNS)
+    return pd.read_json(block, lines=True, dtype=False)[CLAIM_COLUMNS]
+
+
+# Function to read newline-delimited chunks (CSV / JSONL) starting at a byte offset
+# Yields (DataFrame, next_offset) so the caller can checkpoint exactly where it stopped
+def iter_text_chunks(path, log_format, offset=0, chunk_rows=1_000_000):
+    with open(path, "rb") as f:
+        header = f.readline() if log_format == "csv" else b""
+        if offset > f.tell():
+            f.seek(offset)
+        while True:
+            lines = list(islice(f, chunk_rows))
+            if not lines:
+                break
+            position = f.tell()
+            tail = None
+            if not lines[-1].endswith(b"\n"):
+                # A last line without a newline may be complete or still being appended to: it is
+                # counted now but yielded without a position, so checkpoints stop before it and a
+                # later run re-reads it
+                tail = lines.pop()
+                position -= len(tail)
+            if lines:
+                yield parse_text_block(header, lines, log_format), position
+            if tail is not None:
+                try:
+                    yield parse_text_block(header, [tail], log_format), None
+                except ValueError:
+                    pass  # Half-written row: wait for the rest of it
+                break
+
+
+# Function to read Parquet logs row group by row group, resuming at a row group index
+# Batches inside a row group yield no position, so checkpoints only land on row group boundaries
+def iter_parquet_chunks(path, row_group=0, chunk_rows=1_000_000):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    for group in range(row_group, parquet_file.num_row_groups):
+        pending = None
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, row_groups=[group], columns=CLAIM_COLUMNS):
+            if pending is not None:
+                yield pending.to_pandas(), None
+            pending = batch
+        if pending is not None:
+            # Only advance the resume position once the whole row group is aggregated
+            yield pending.to_pandas(), group + 1
+
+
+# Function to map claim timestamps onto months since TGE (month 0 = TGE month)
+def timestamps_to_periods(timestamps, tge_date):
+    if pd.api.types.is_numeric_dtype(timestamps):
+        moments = pd.to_datetime(timestamps, unit="s", utc=True)
+    else:
+        moments = pd.to_datetime(timestamps, utc=True, format="mixed")
+    months = moments.dt.tz_localize(None).values.astype("datetime64[M]")
+    return (months - np.datetime64(tge_date, "M")).astype(np.int64)
+
+
+# Function to add one chunk of claims into the category x period grids in place
+def aggregate_claim_chunk(chunk, categories, tge_date, claimed, claim_count):
+    n_periods = claimed.shape[1]
+    category_index = pd.Categorical(chunk["category"], categories=categories).codes.astype(np.int64)
+    periods = timestamps_to_periods(chunk["timestamp"], tge_date)
+    amounts = pd.to_numeric(chunk["amount"], errors="coerce").to_numpy(dtype=float)
+
+    valid = (category_index >= 0) & (periods >= 0) & (periods < n_periods) & np.isfinite(amounts)
+    cells = category_index[valid] * n_periods + periods[valid]
+    claimed += np.bincount(cells, weights=amounts[valid], minlength=claimed.size).reshape(claimed.shape)
+    claim_count += np.bincount(cells, minlength=claim_count.size).reshape(claim_count.shape)
+    return int(valid.sum()), int((~valid).sum())
+
+
+# Function to fingerprint a log file (inode, size and a hash of its first block)
+def file_identity(path, head_bytes=None):
+    stat = os.stat(path)
+    head_bytes = min(stat.st_size, 65_536) if head_bytes is None else head_bytes
+    with open(path, "rb") as f:
+        head = hashlib.sha256(f.read(head_bytes)).hexdigest()
+    return {"inode": stat.st_ino, "size": stat.st_size, "head_bytes": head_bytes, "head": head}
+
+
+# Function to check a log is the same file a checkpoint was written for, possibly appended to since
+# A replaced, rotated or truncated log fails the check, so its replay restarts from the beginning
+def is_same_log(path, identity):
+    stat = os.stat(path)
+    if stat.st_ino != identity["inode"] or stat.st_size < identity["size"]:
+        return False
+    return file_identity(path, identity["head_bytes"])["head"] == identity["head"]
+
+
+# Function to load a checkpoint if it was written for the same grid layout and the same log file
+def load_checkpoint(checkpoint_path, settings, path):
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return None
+    with np.load(checkpoint_path) as data:
+        if json.loads(str(data["settings"])) != settings or "identity" not in data:
+            return None
+        if not is_same_log(path, json.loads(str(data["identity"]))):
+            return None
+        return {
+            "claimed": data["claimed"].copy(),
+            "claim_count": data["claim_count"].copy(),
+            "position": int(data["position"]),
+            "rows": int(data["rows"]),
+            "dropped": int(data["dropped"]),
+        }
+
+
+# Function to copy replay state so later chunks do not modify a checkpoint snapshot
+def copy_state(state):
+    return {key: value.copy() if isinstance(value, np.ndarray) else value for key, value in state.items()}
+
+
+# Function to write a checkpoint atomically so a crash never leaves a half-written file
+# Returns False instead of raising when the checkpoint location is not writable
+def save_checkpoint(checkpoint_path, settings, identity, state):
+    temp_path = checkpoint_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            np.savez(f, settings=json.dumps(settings), identity=json.dumps(identity), **state)
+        os.replace(temp_path, checkpoint_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    return True
+
+
+# Function to stream a claim log into category x period grids with constant memory
+# Re-running with the same checkpoint only reads events appended since the last run
+def replay_claim_log(path, categories, tge_date, months=48, chunk_rows=1_000_000,
+                     checkpoint_path=None, checkpoint_every=1):
+    log_format = detect_log_format(path)
+    settings = {
+        "source": os.path.abspath(path),
+        "format": log_format,
+        "categories": list(categories),
+        "tge_date": str(np.datetime64(tge_date, "M")),
+        "months": months,
+    }
+
+    # Fingerprint before reading: anything appended while replaying is simply re-checked next run
+    identity = file_identity(path)
+    state = load_checkpoint(checkpoint_path, settings, path) or {
+        "claimed": np.zeros((len(categories), months + 1)),
+        "claim_count": np.zeros((len(categories), months + 1), dtype=np.int64),
+        "position": 0,
+        "rows": 0,
+        "dropped": 0,
+    }
+
+    if log_format == "parquet":
+        chunks = iter_parquet_chunks(path, state["position"], chunk_rows)
+    else:
+        chunks = iter_text_chunks(path, log_format, state["position"], chunk_rows)
+
+    # Checkpoints only ever cover rows up to the last resume position
+    resumable = copy_state(state)
+    for i, (chunk, position) in enumerate(chunks, start=1):
+        kept, dropped = aggregate_claim_chunk(chunk, categories, tge_date, state["claimed"], state["claim_count"])
+        state["rows"] += kept
+        state["dropped"] += dropped
+        if position is None:
+            continue
+        state["position"] = position
+        resumable = copy_state(state)
+        if checkpoint_path and i % checkpoint_every == 0 and not save_checkpoint(checkpoint_path, settings, identity, resumable):
+            checkpoint_path = None
+
+    if checkpoint_path:
+        save_checkpoint(checkpoint_path, settings, identity, resumable)
+    return state
+
+
+# Function to line up actual claims against the modeled unlock schedule
+def compare_claims_with_schedule(claimed, scheduled, total_supply):
+    scheduled_supply = calculate_cumulative_supply(scheduled, total_supply)
+    actual_supply = calculate_cumulative_supply(claimed, total_supply)
+    return pd.DataFrame({
+        "Month": np.arange(len(scheduled_supply)),
+        "Scheduled Circulating %": scheduled_supply,
+        "Actual Circulating %": actual_supply,
+        "Scheduled Shock %": calculate_shock_series(scheduled_supply),
+        "Actual Shock %": calculate_shock_series(actual_supply),
+        "Unclaimed (Tokens)": (scheduled_supply - actual_supply) / 100 * total_supply,
+    })
@@ -0,0 +1,88 @@
+import numpy as np
+
+from vesting_curves import expand_vesting_buckets
+from vesting_segments import compile_segments, calculate_cumulative_unlocked
+
+# Every wallet in a vesting bucket (a category, or a private sale tier) holds a fixed share of what that
+# bucket has unlocked, so within a bucket the wallet order never changes. Shares are sorted once;
+# each month only rescales whole buckets, and metrics come from threshold queries on the sorted shares
+# (binary search + suffix sums) instead of re-sorting millions of balances.
+
+
+# Function to draw Pareto-distributed wallet shares of a bucket, sorted ascending and summing to one
+def generate_wallet_shares(rng, wallets, alpha):
+    weights = np.sort(rng.pareto(alpha, int(wallets)) + 1)
+    return weights / weights.sum()
+
+
+# Function to build sorted wallet shares and cumulative unlocks for every vesting bucket
+# holder_population: {category: {"wallets": count or {tier: count}, "alpha": Pareto tail index}}
+def build_holder_buckets(allocations, vesting_schedule, private_sale_tiers, holder_population, months=48, seed=0):
+    rng = np.random.default_rng(seed)
+    categories = list(allocations.keys())
+    buckets = expand_vesting_buckets(allocations, vesting_schedule, private_sale_tiers)
+    bucket_segments = compile_segments(allocations, vesting_schedule, private_sale_tiers, per_bucket=True)
+    unlocked = calculate_cumulative_unlocked(bucket_segments, np.arange(months + 1))
+
+    shares, suffix_sums = [], []
+    for row, _, spec in buckets:
+        population = holder_population[categories[row]]
+        wallets = population["wallets"][spec["tier"]] if "tier" in spec else population["wallets"]
+        bucket_shares = generate_wallet_shares(rng, wallets, population["alpha"])
+        shares.append(bucket_shares)
+        suffix_sums.append(np.concatenate([np.cumsum(bucket_shares[::-1])[::-1], [0]]))
+    return {"shares": shares, "suffix_sums": suffix_sums, "unlocked": unlocked}
+
+
+# Function to count wallets and sum balances at or above threshold values (any shape, last axis = period)
+def holders_at_or_above(holders, thresholds):
+    count = np.zeros(thresholds.shape)
+    balance = np.zeros(thresholds.shape)
+    for shares, suffix_sums, unlocked in zip(holders["shares"], holders["suffix_sums"], holders["unlocked"]):
+        share_threshold = np.divide(thresholds, unlocked, out=np.full(thresholds.shape, np.inf), where=unlocked > 0)
+        index = np.searchsorted(shares, share_threshold, side="left")
+        count += len(shares) - index
+        balance += unlocked * suffix_sums[index]
+    return count, balance
+
+
+# Function to bisect (in log space) for the balance level where a monotone holder condition flips
+# condition(level) must be True at low and False at high; returns the bracketing (low, high) per period
+def bisect_balance(holders, condition, low, high, iterations=80):
+    for _ in range(iterations):
+        middle = np.sqrt(low * high)
+        holds = condition(*holders_at_or_above(holders, middle))
+        low = np.where(holds, middle, low)
+        high = np.where(holds, high, middle)
+    return low, high
+
+
+# Function to compute Gini, Nakamoto coefficient and top-N holder share for every period
+def calculate_concentration(holders, top_n=(10, 100), grid_points=1024):
+    unlocked = holders["unlocked"]
+    active = unlocked > 0
+    smallest = np.array([shares[0] for shares in holders["shares"]])[:, None] * unlocked
+    largest = np.array([shares[-1] for shares in holders["shares"]])[:, None] * unlocked
+    low = np.where(active, smallest, np.inf).min(axis=0)
+    high = largest.max(axis=0) * (1 + 1e-9)
+    total_wallets, total_balance = holders_at_or_above(holders, low)
+
+    # Lorenz curve sampled on a log-spaced balance grid per period
+    grid = np.exp(np.linspace(np.log(low), np.log(high), grid_points))
+    count, balance = holders_at_or_above(holders, grid)
+    population = np.vstack([1 - count / total_wallets, np.ones(len(low))])
+    wealth = np.vstack([1 - balance / total_balance, np.ones(len(low))])
+    gini = 1 - np.sum(np.diff(population, axis=0) * (wealth[1:] + wealth[:-1]), axis=0)
+
+    # Nakamoto coefficient: fewest wallets holding at least half of circulating supply
+    half = total_balance / 2
+    majority_low, _ = bisect_balance(holders, lambda count, balance: balance >= half, low, high)
+    nakamoto, _ = holders_at_or_above(holders, majority_low)
+
+    result = {"gini": gini, "nakamoto": nakamoto, "holders": total_wallets}
+    for n in top_n:
+        level_low, level_high = bisect_balance(holders, lambda count, balance: count >= n, low, high)
+        count_high, balance_high = holders_at_or_above(holders, level_high)
+        top_balance = balance_high + np.clip(n - count_high, 0, None) * level_low
+        result[f"top_{n}_share"] = np.minimum(top_balance / total_balance, 1) * 100
+    return result
@@ -0,0 +1,77 @@
+import os
+import time
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+# Simulators are plain top-level functions simulate(rng, n_paths, **params) -> (n_paths, n_periods) array,
+# so worker processes can import them by name (see amm.simulate_price_paths).
+
+
+# Function run inside each worker: simulate one shard of paths straight into the shared result array
+def run_shard(task):
+    simulate, block_name, shape, start, stop, seed, params = task
+    # Workers share the parent's resource tracker, so the parent alone unlinks the block
+    block = shared_memory.SharedMemory(name=block_name)
+    try:
+        paths = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        paths[start:stop] = simulate(np.random.default_rng(seed), stop - start, **params)
+    finally:
+        block.close()
+    return stop - start
+
+
+# Function to run a simulator over many paths across a process pool and reduce to percentile bands
+# Shards get their own SeedSequence children, so results are identical for any number of workers
+def run_monte_carlo(simulate, n_paths, n_periods, params=None, n_workers=None, shard_size=10_000,
+                    seed=0, percentiles=(5, 50, 95), keep_paths=False):
+    n_workers = n_workers or os.cpu_count()
+    shape = (n_paths, n_periods)
+    starts = list(range(0, n_paths, shard_size))
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+
+    block = shared_memory.SharedMemory(create=True, size=n_paths * n_periods * 8)
+    try:
+        paths = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        tasks = [
+            (simulate, block.name, shape, start, min(start + shard_size, n_paths), shard_seed, params or {})
+            for start, shard_seed in zip(starts, seeds)
+        ]
+
+        if n_workers == 1:
+            started = time.perf_counter()
+            for task in tasks:
+                run_shard(task)
+            elapsed = time.perf_counter() - started
+        else:
+            # Spawned workers avoid forking a threaded dashboard server; pool start-up is not timed
+            with get_context("spawn").Pool(n_workers) as pool:
+                started = time.perf_counter()
+                pool.map(run_shard, tasks, chunksize=1)
+                elapsed = time.perf_counter() - started
+
+        result = {"mean": paths.mean(axis=0), "elapsed": elapsed, "n_workers": n_workers}
+        if keep_paths:
+            result["paths"] = paths.copy()
+        # Percentiles partition the shared array in place instead of copying it
+        result["bands"] = np.percentile(paths, percentiles, axis=0, overwrite_input=True)
+        del paths
+    finally:
+        block.close()
+        block.unlink()
+    return result
+
+
+# Function to time the same run at several worker counts and report speedup and per-core efficiency
+def benchmark_scaling(simulate, n_paths, n_periods, params=None, worker_counts=(1, 2, 4, 8), shard_size=10_000, seed=0):
+    report = []
+    for n_workers in worker_counts:
+        elapsed = run_monte_carlo(simulate, n_paths, n_periods, params, n_workers, shard_size, seed)["elapsed"]
+        baseline = report[0]["Seconds"] if report else elapsed
+        report.append({
+            "Workers": n_workers,
+            "Seconds": elapsed,
+            "Speedup": baseline / elapsed,
+            "Efficiency": baseline / elapsed / (n_workers / worker_counts[0]),
+        })
+    return report
@@ -0,0 +1,214 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, eviction just races harmlessly
+    fcntl = None
+
+# Content-addressed result store shared by dashboard workers and batch jobs.
+# Each result is a directory <store>/<key[:2]>/<key>/ holding one file per named value:
+# arrays as .npy (loaded memory-mapped), DataFrames as Arrow feather, Plotly figures as JSON and
+# anything else in values.json. Keys cover the inputs and the source of every repo module the computation
+# reaches, so editing any of them rebuilds its results. Entries are written to a temp directory and
+# renamed into place, so readers never see a partial result; eviction removes least recently used
+# entries under an exclusive lock while readers hold a shared one.
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+# Resolved against the repo, not the working directory, so every dashboard worker and batch job shares it
+DEFAULT_STORE_DIR = os.path.abspath(os.environ.get("TOKENOMICS_STORE_DIR", os.path.join(REPO_DIR, ".result_store")))
+DEFAULT_MAX_BYTES = int(os.environ.get("TOKENOMICS_STORE_MAX_BYTES", 512 * 1024 ** 2))
+FIGURE_SUFFIX = ".figure.json"
+
+
+# Function to make numpy values JSON-serializable when hashing inputs
+def json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot hash {type(value).__name__} in result store inputs")
+
+
+# Function to find the repo module an object is defined in (None for library and dashboard script code)
+def repo_module(value):
+    module = inspect.getmodule(value)
+    path = getattr(module, "__file__", None)
+    if module is None or module.__name__ == "__main__" or not path:
+        return None
+    return module if os.path.abspath(path).startswith(REPO_DIR + os.sep) else None
+
+
+# Function to list the global names a function's code (including nested functions and lambdas) refers to
+def referenced_names(code):
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if inspect.iscode(constant):
+            names |= referenced_names(constant)
+    return names
+
+
+# Function to hash the source of everything a computation reaches in this repo
+# Repo modules are hashed whole, together with the repo modules they import from; functions defined
+# outside a module (the dashboard script) are hashed by their own source plus the globals they call
+def code_version(*entry_points):
+    sources, seen = {}, set()
+    pending = list(entry_points)
+    while pending:
+        value = pending.pop()
+        module = value if inspect.ismodule(value) else repo_module(value)
+        if module is not None and repo_module(module) is module:
+            if module.__name__ in seen:
+                continue
+            seen.add(module.__name__)
+            sources[module.__name__] = inspect.getsource(module)
+            pending.extend(member for member in vars(module).values()
+                           if (inspect.ismodule(member) or callable(member)) and repo_module(member) is not None)
+        elif inspect.isfunction(value) and os.path.abspath(value.__code__.co_filename).startswith(REPO_DIR + os.sep):
+            name = f"{value.__code__.co_filename}:{value.__qualname__}"
+            if name in seen:
+                continue
+            seen.add(name)
+            sources[name] = inspect.getsource(value)
+            pending.extend(value.__globals__[global_name] for global_name in referenced_names(value.__code__)
+                           if callable(value.__globals__.get(global_name)) or inspect.ismodule(value.__globals__.get(global_name)))
+    return hashlib.sha256(json.dumps(sources, sort_keys=True).encode()).hexdigest()
+
+
+# Function to derive the store key from a namespace, the inputs and the code version
+def store_key(namespace, inputs, code):
+    payload = json.dumps({"namespace": namespace, "inputs": inputs, "code": code},
+                         sort_keys=True, default=json_default)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Function to hold the store-wide lock: shared for reads and renames, exclusive for eviction
+@contextmanager
+def store_lock(store_dir, exclusive=False):
+    os.makedirs(store_dir, exist_ok=True)
+    with open(os.path.join(store_dir, ".lock"), "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+# Function to locate an entry directory, fanned out by key prefix
+def entry_path(store_dir, key):
+    return os.path.join(store_dir, key[:2], key)
+
+
+# Function to load a stored result as {name: value}, or None on a miss
+# Arrays come back memory-mapped read-only, so large results cost nothing until they are touched
+def load_result(key, store_dir=DEFAULT_STORE_DIR):
+    path = entry_path(store_dir, key)
+    if not os.path.isdir(path):
+        return None
+    with store_lock(store_dir):
+        if not os.path.isdir(path):
+            return None
+        result = {}
+        for file_name in os.listdir(path):
+            file_path = os.path.join(path, file_name)
+            if file_name.endswith(".npy"):
+                result[file_name[:-4]] = np.load(file_path, mmap_mode="r")
+            elif file_name.endswith(".feather"):
+                import pyarrow.feather as feather
+
+                result[file_name[:-8]] = feather.read_table(file_path, memory_map=True).to_pandas()
+            elif file_name.endswith(FIGURE_SUFFIX):
+                import plotly.io as pio
+
+                with open(file_path) as f:
+                    result[file_name[:-len(FIGURE_SUFFIX)]] = pio.from_json(f.read(), skip_invalid=True)
+            elif file_name == "values.json":
+                with open(file_path) as f:
+                    result.update(json.load(f))
+        # Reads refresh the entry's mtime, which is what eviction orders by
+        os.utime(path)
+    return result
+
+
+# Function to write a {name: value} result atomically, then trim the store back under max_bytes
+# (max_bytes=None skips eviction, for bulk writers that call evict_results once at the end)
+def save_result(key, result, store_dir=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    path = entry_path(store_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.dirname(path))
+    try:
+        values = {}
+        for name, value in result.items():
+            if isinstance(value, np.ndarray):
+                np.save(os.path.join(temp_path, name + ".npy"), value)
+            elif isinstance(value, pd.DataFrame):
+                import pyarrow.feather as feather
+
+                feather.write_feather(value, os.path.join(temp_path, name + ".feather"))
+            elif hasattr(value, "to_plotly_json"):
+                with open(os.path.join(temp_path, name + FIGURE_SUFFIX), "w") as f:
+                    f.write(value.to_json())
+            else:
+                values[name] = value
+        with open(os.path.join(temp_path, "values.json"), "w") as f:
+            json.dump(values, f, default=json_default)
+
+        with store_lock(store_dir):
+            try:
+                os.rename(temp_path, path)
+            except OSError:
+                # Another process stored the same key first; its result is identical
+                shutil.rmtree(temp_path, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        raise
+    if max_bytes is not None:
+        evict_results(store_dir, max_bytes)
+
+
+# Function to evict least recently used entries until the store fits in max_bytes
+# Temp directories older than an hour are leftovers from crashed writers and are removed too
+def evict_results(store_dir=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    with store_lock(store_dir, exclusive=True):
+        entries, total_bytes = [], 0
+        for prefix in os.listdir(store_dir):
+            prefix_path = os.path.join(store_dir, prefix)
+            if not os.path.isdir(prefix_path):
+                continue
+            for name in os.listdir(prefix_path):
+                path = os.path.join(prefix_path, name)
+                if name.startswith(".tmp-"):
+                    if time.time() - os.path.getmtime(path) > 3600:
+                        shutil.rmtree(path, ignore_errors=True)
+                    continue
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                entries.append((os.path.getmtime(path), size, path))
+                total_bytes += size
+
+        for _, size, path in sorted(entries):
+            if total_bytes <= max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_bytes -= size
+
+
+# Function to return a stored result, computing and storing it on a miss
+# compute() returns a {name: value} dict; a hit returns the loaded (memory-mapped) values instead.
+# The code version is derived from compute itself, so it covers every repo module compute calls into.
+def cached_result(namespace, inputs, compute, store_dir=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    key = store_key(namespace, inputs, code_version(compute))
+    result = load_result(key, store_dir)
+    if result is None:
+        result = compute()
+        save_result(key, result, store_dir, max_bytes)
+    return result
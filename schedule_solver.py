@@ -0,0 +1,111 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linprog
+
+from supply_engine import calculate_cumulative_supply, calculate_shock_series
+
+
+# Function to design per-category release curves with a linear program over the category x month matrix
+# constraints: {category: {"cliff": months, "max_tge": % of allocation, "end": last release month}}
+# objective "fastest" releases each category as early as the caps allow,
+# "smoothest" minimizes the largest post-TGE monthly release
+def solve_unlock_schedule(allocations, constraints, months=240, max_shock=5, min_tge_float=5,
+                          monotone=True, objective="fastest"):
+    categories = list(allocations.keys())
+    n_categories, n_periods = len(categories), months + 1
+    n_unlocks = n_categories * n_periods
+    supply_index = n_unlocks + np.arange(n_periods)  # Cumulative released tokens per month
+    peak_index = n_unlocks + n_periods  # Largest post-TGE monthly release
+    n_vars = peak_index + 1
+    total_supply = sum(allocations.values())
+
+    def unlock_index(c, m):
+        return c * n_periods + m
+
+    bounds = [(0, None)] * n_vars
+    eq_rows, eq_cols, eq_vals, b_eq = [], [], [], []
+    ub_rows, ub_cols, ub_vals, b_ub = [], [], [], []
+
+    for c, category in enumerate(categories):
+        rules = constraints.get(category, {})
+        cliff = rules.get("cliff", 0)
+        end = min(rules.get("end", months), months)
+        tokens = allocations[category]
+
+        # Each category releases exactly its allocation
+        row = len(b_eq)
+        eq_rows += [row] * n_periods
+        eq_cols += [unlock_index(c, m) for m in range(n_periods)]
+        eq_vals += [1] * n_periods
+        b_eq.append(tokens)
+
+        bounds[unlock_index(c, 0)] = (0, tokens * rules.get("max_tge", 100) / 100)
+        for m in range(1, n_periods):
+            if m <= cliff or m > end:
+                bounds[unlock_index(c, m)] = (0, 0)
+
+        # Monotone release: after the cliff, the monthly release never increases
+        if monotone:
+            for m in range(cliff + 1, end):
+                row = len(b_ub)
+                ub_rows += [row, row]
+                ub_cols += [unlock_index(c, m + 1), unlock_index(c, m)]
+                ub_vals += [1, -1]
+                b_ub.append(0)
+
+    # Cumulative supply links: S[m] - S[m-1] - sum_c x[c, m] = 0
+    for m in range(n_periods):
+        row = len(b_eq)
+        eq_rows += [row] * (n_categories + 1)
+        eq_cols += [unlock_index(c, m) for c in range(n_categories)] + [supply_index[m]]
+        eq_vals += [-1] * n_categories + [1]
+        if m > 0:
+            eq_rows.append(row)
+            eq_cols.append(supply_index[m - 1])
+            eq_vals.append(-1)
+        b_eq.append(0)
+
+    # Shock cap: S[m] <= (1 + max_shock) * S[m-1], and the peak release bound for the smooth objective
+    for m in range(1, n_periods):
+        row = len(b_ub)
+        ub_rows += [row, row]
+        ub_cols += [supply_index[m], supply_index[m - 1]]
+        ub_vals += [1, -(1 + max_shock / 100)]
+        b_ub.append(0)
+
+        row = len(b_ub)
+        ub_rows += [row] * (n_categories + 1)
+        ub_cols += [unlock_index(c, m) for c in range(n_categories)] + [peak_index]
+        ub_vals += [1] * n_categories + [-1]
+        b_ub.append(0)
+
+    bounds[supply_index[0]] = (total_supply * min_tge_float / 100, None)
+
+    cost = np.zeros(n_vars)
+    if objective == "smoothest":
+        cost[peak_index] = 1
+    else:
+        # Mean release month per category, each category weighted equally
+        for c, category in enumerate(categories):
+            cost[c * n_periods:(c + 1) * n_periods] = np.arange(n_periods) / allocations[category]
+
+    result = linprog(
+        cost,
+        A_ub=sparse.csr_matrix((ub_vals, (ub_rows, ub_cols)), shape=(len(b_ub), n_vars)),
+        b_ub=b_ub,
+        A_eq=sparse.csr_matrix((eq_vals, (eq_rows, eq_cols)), shape=(len(b_eq), n_vars)),
+        b_eq=b_eq,
+        bounds=bounds,
+        method="highs"
+    )
+    if result.status != 0:
+        raise ValueError(f"No unlock schedule satisfies the constraints: {result.message}")
+
+    unlocks = np.maximum(result.x[:n_unlocks].reshape(n_categories, n_periods), 0)
+    supply = calculate_cumulative_supply(unlocks, total_supply)
+    return {
+        "categories": categories,
+        "unlocks": unlocks,
+        "supply": supply,
+        "shocks": calculate_shock_series(supply),
+    }
@@ -0,0 +1,26 @@
+import numpy as np
+
+from vesting_segments import compile_segments, densify_segments
+
+
+# Function to calculate the category x month unlock grid (tokens) from the declared vesting curves
+def calculate_unlock_matrix(allocations, vesting_schedule, private_sale_tiers=None, months=48):
+    return densify_segments(compile_segments(allocations, vesting_schedule, private_sale_tiers), months)
+
+
+# Function to turn a category x period unlock grid (tokens) into cumulative circulating supply (%)
+# Works on any leading axes (scenarios, Monte Carlo paths), the last two being category and period
+def calculate_cumulative_supply(unlocks, total_supply):
+    unlocks = np.asarray(unlocks, dtype=float)
+    return np.cumsum(unlocks.sum(axis=-2), axis=-1) / total_supply * 100
+
+
+# Function to calculate period-over-period supply shocks (%) along the last axis
+def calculate_shock_series(supply):
+    supply = np.asarray(supply, dtype=float)
+    shocks = np.zeros_like(supply)
+    previous = supply[..., :-1]
+    change = supply[..., 1:] - previous
+    # No prior supply means no shock, matching calculate_supply_shocks in the dashboard
+    np.divide(change * 100, previous, out=shocks[..., 1:], where=previous > 0)
+    return shocks
@@ -1,8 +1,23 @@
+import hashlib
+import os
+import time
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
 from plotly.subplots import make_subplots
+from claim_replay import replay_claim_log, compare_claims_with_schedule
+from claim_behavior import simulate_claim_behavior
+from supply_engine import calculate_unlock_matrix, calculate_cumulative_supply, calculate_shock_series
+from amm import simulate_price_impact, sample_buy_demand, simulate_price_paths
+from monte_carlo import run_monte_carlo, benchmark_scaling
+from schedule_solver import solve_unlock_schedule
+from what_if import calculate_unlock_basis, apply_allocation_what_if
+from vesting_segments import compile_segments, densify_segments
+from unlock_events import upcoming_unlocks
+from holder_concentration import build_holder_buckets, calculate_concentration
+from treasury import simulate_treasury_runway
+from result_store import cached_result
 
 # Set page configuration
 st.set_page_config(
@@ -202,15 +217,16 @@ private_sale_tiers = {
 }
 
 # Vesting and Unlock Schedules (in months, percentages unlocked over time)
+# Each category declares its curve shape; see vesting_curves.py for the available curves
 vesting_schedule = {
-    "Private Sale": {"tge": 5, "vesting_period": 12, "cliff": 0},  # 5% at TGE, 95% over 12 months (tiered)
-    "VC Round": {"tge": 5, "vesting_period": 18, "cliff": 6},  # 5% at TGE, 6-month cliff, 95% over 18 months
-    "Launchpad": {"tge": 25, "vesting_period": 4, "cliff": 0},  # 25% at TGE, 75% over 4 months
-    "Team": {"tge": 0, "vesting_period": 108, "cliff": 12},  # 0% at TGE, 12-month cliff, 100% over 108 months
-    "Advisors": {"tge": 0, "vesting_period": 108, "cliff": 12},  # 0% at TGE, 12-month cliff, 100% over 108 months
-    "Treasury": {"tge": 5, "vesting_period": 108, "cliff": 12},  # 5% at TGE, 12-month cliff, 95% over 108 months
-    "Community & Ecosystem": {"tge": 5, "vesting_period": 240, "cliff": 0},  # 5% at TGE, activity-based (placeholder: 500K ED/month)
-    "Exchange & Liquidity": {"tge": 10, "vesting_period": 18, "cliff": 0}  # 10% at TGE, 90% over 18 months
+    "Private Sale": {"curve": "tiered", "tge": 5, "vesting_period": 12, "cliff": 0},  # 5% at TGE, 95% over 12 months (tiered)
+    "VC Round": {"curve": "catch_up", "tge": 5, "vesting_period": 18, "cliff": 6},  # 5% at TGE, 6-month cliff, 95% over 18 months, cliff months released at month 7
+    "Launchpad": {"curve": "linear", "tge": 25, "vesting_period": 4, "cliff": 0},  # 25% at TGE, 75% over 4 months
+    "Team": {"curve": "linear", "tge": 0, "vesting_period": 108, "cliff": 12},  # 0% at TGE, 12-month cliff, 100% over 108 months
+    "Advisors": {"curve": "linear", "tge": 0, "vesting_period": 108, "cliff": 12},  # 0% at TGE, 12-month cliff, 100% over 108 months
+    "Treasury": {"curve": "linear", "tge": 5, "vesting_period": 108, "cliff": 12},  # 5% at TGE, 12-month cliff, 95% over 108 months
+    "Community & Ecosystem": {"curve": "fixed_rate", "tge": 5, "vesting_period": 240, "cliff": 0, "start": 3, "rate": 500_000},  # 5% at TGE, activity-based (placeholder: 500K ED/month from month 3)
+    "Exchange & Liquidity": {"curve": "linear", "tge": 10, "vesting_period": 18, "cliff": 0}  # 10% at TGE, 90% over 18 months
 }
 
 # Investor Rounds Data
@@ -220,6 +236,46 @@ investor_rounds = {
     "Launchpad": {"tokens": 60_000_000, "price_per_token": 0.02, "amount_raised": 1_200_000, "fdv": 20_000_000}
 }
 
+# TGE date used to bucket on-chain claim timestamps into months since TGE
+tge_date = "2025-01-01"
+
+# Holder behavior assumptions per category: mean months from unlock to claim,
+# mean months from claim to sale, and the share of claimed tokens eventually sold
+claim_behavior = {
+    "Private Sale": {"claim_delay": 1, "sell_delay": 1, "sell_through": 0.8},
+    "VC Round": {"claim_delay": 0, "sell_delay": 0.5, "sell_through": 0.9},  # VCs claim and sell fast
+    "Launchpad": {"claim_delay": 0.5, "sell_delay": 1, "sell_through": 0.7},
+    "Team": {"claim_delay": 3, "sell_delay": 12, "sell_through": 0.3},  # Team holds
+    "Advisors": {"claim_delay": 2, "sell_delay": 6, "sell_through": 0.5},
+    "Treasury": {"claim_delay": 6, "sell_delay": 24, "sell_through": 0.2},
+    "Community & Ecosystem": {"claim_delay": 1, "sell_delay": 3, "sell_through": 0.6},
+    "Exchange & Liquidity": {"claim_delay": 0, "sell_delay": 0, "sell_through": 0}  # Stays in the pool
+}
+
+# DEX pool assumptions: swap fee and organic buy demand (USD per month, lognormal volatility)
+amm_settings = {"fee": 0.003, "monthly_buy_demand": 250_000, "demand_volatility": 0.5}
+
+# Treasury spend plans (USD): monthly burn from Month 1, grant commitments by month, fiat on hand at TGE;
+# whatever the fiat reserve cannot cover is funded by selling vested Treasury tokens
+treasury_spend_plans = {
+    "Lean": {"monthly_burn": 80_000, "grants": {}, "fiat_reserve": 1_000_000},
+    "Base": {"monthly_burn": 150_000, "grants": {6: 250_000, 12: 250_000, 24: 500_000}, "fiat_reserve": 2_500_000},
+    "Aggressive": {"monthly_burn": 300_000, "grants": {3: 500_000, 6: 500_000, 12: 1_000_000}, "fiat_reserve": 4_000_000}
+}
+
+# Wallet population per category (per tier for the Private Sale) and Pareto tail index of holdings;
+# Treasury and Exchange & Liquidity are single wallets (multisig and pool)
+holder_population = {
+    "Private Sale": {"wallets": {">$10K": 6, "$5K-$10K": 15, "$0-$5K": 120}, "alpha": 2.0},
+    "VC Round": {"wallets": 12, "alpha": 1.5},
+    "Launchpad": {"wallets": 20_000, "alpha": 1.8},
+    "Team": {"wallets": 25, "alpha": 1.5},
+    "Advisors": {"wallets": 10, "alpha": 2.0},
+    "Treasury": {"wallets": 1, "alpha": 1.0},
+    "Community & Ecosystem": {"wallets": 1_000_000, "alpha": 1.3},
+    "Exchange & Liquidity": {"wallets": 1, "alpha": 1.0}
+}
+
 # Projected market cap and token price at Month 48
 market_cap_month_48 = 500_000_000  # $500M
 
@@ -230,78 +286,16 @@ allocations = {
     "Community & Ecosystem": 480_000_000, "Exchange & Liquidity": 20_000_000
 }
 
-# Function to calculate monthly unlocks for Private Sale with tiers
-def calculate_private_sale_unlocks(month, tiers):
-    if month == 0:
-        # TGE unlock (5% of each tier)
-        return sum([tier["allocation"] * tier["tge"] / 100 for tier in tiers.values()])
-    
-    monthly_unlock = 0
-    for tier_name, tier in tiers.items():
-        if month <= tier["vesting_period"]:
-            monthly_unlock += tier["monthly_unlock"]
-    
-    return monthly_unlock
-
-# Function to calculate monthly unlocks for each category
-def calculate_monthly_unlock(category, month, allocations, vesting_schedule):
-    tokens = allocations[category]
-    schedule = vesting_schedule[category]
-    tge_percent = schedule["tge"] / 100
-    vesting_period = schedule["vesting_period"]
-    cliff = schedule["cliff"]
-    
-    if month == 0:
-        return tokens * tge_percent
-    elif month <= cliff:
-        return 0
-    elif month <= vesting_period + cliff:
-        if category == "VC Round" and month == cliff + 1:
-            # For VC Round with cliff, first month after cliff includes delayed unlocks
-            monthly_amount = tokens * (1 - tge_percent) / vesting_period
-            delayed_unlocks = monthly_amount * cliff
-            return monthly_amount + delayed_unlocks
-        elif category == "Treasury" and month == cliff + 1:
-            # For Treasury with cliff, linear vesting after cliff
-            monthly_amount = tokens * (1 - tge_percent) / vesting_period
-            return monthly_amount
-        elif category == "Exchange & Liquidity":
-            # For Exchange & Liquidity
-            monthly_amount = tokens * (1 - tge_percent) / vesting_period
-            return monthly_amount
-        elif category == "Community & Ecosystem":
-            # Activity-based distribution - simulated worker activity
-            if month <= 2:
-                return 0  # No unlocks in first 2 months after TGE
-            else:
-                # Start with 500,000 tokens per month from month 3
-                return 500_000
-        else:
-            monthly_amount = tokens * (1 - tge_percent) / vesting_period
-            return monthly_amount
-    else:
-        return 0
-
 # Function to calculate circulating and unlocked supply over time based on vesting schedules
 def calculate_supplies(allocations, vesting_schedule, private_sale_tiers, months=48):
-    months_range = np.arange(months + 1)
-    circulating_supply = np.zeros(len(months_range))
-    
-    for month in months_range:
-        total_unlocked = 0
-        for category, tokens in allocations.items():
-            if category == "Private Sale":
-                total_unlocked += calculate_private_sale_unlocks(month, private_sale_tiers)
-            else:
-                total_unlocked += calculate_monthly_unlock(category, month, allocations, vesting_schedule)
-        circulating_supply[month] = (total_unlocked / total_supply) * 100
+    # Schedules are kept as compact segments and only densified for the requested horizon
+    schedule_segments = compile_segments(allocations, vesting_schedule, private_sale_tiers)
+    unlock_matrix = densify_segments(schedule_segments, months)
+    circulating_supply = unlock_matrix.sum(axis=0) / total_supply * 100
     
     # For simplicity, assume unlocked supply equals circulating supply
     return circulating_supply, circulating_supply
 
-# Calculate circulating supply
-circulating, unlocked = calculate_supplies(allocations, vesting_schedule, private_sale_tiers)
-
 # Function to calculate supply shocks (month-to-month percentage changes)
 def calculate_supply_shocks(circulating_supply):
     shocks = [0]  # TGE has no prior month
@@ -313,31 +307,55 @@ def calculate_supply_shocks(circulating_supply):
         shocks.append(shock)
     return shocks
 
-# Calculate supply shocks
-monthly_shocks_calculated = calculate_supply_shocks(circulating)
+# Function to compute the schedule results every section builds on
+def compute_schedule_results():
+    # Calculate circulating supply
+    circulating, _ = calculate_supplies(allocations, vesting_schedule, private_sale_tiers)
 
-# Calculate detailed monthly unlocks for the first 12 months
-detailed_unlocks = []
-for month in range(13):  # 0 to 12 months
-    month_data = {"Month": month}
-    total_unlocked = 0
-    
-    # Calculate unlocks for each category
-    for category in allocations.keys():
-        if category == "Private Sale":
-            category_unlocked = calculate_private_sale_unlocks(month, private_sale_tiers)
-        else:
-            category_unlocked = calculate_monthly_unlock(category, month, allocations, vesting_schedule)
-        
-        month_data[category] = category_unlocked
-        total_unlocked += category_unlocked
-    
-    month_data["Total Unlocked"] = total_unlocked
-    month_data["Circulating %"] = (total_unlocked / total_supply) * 100
-    detailed_unlocks.append(month_data)
+    # Scheduled unlocks as a category x month grid (tokens)
+    scheduled_unlocks = calculate_unlock_matrix(allocations, vesting_schedule, private_sale_tiers, len(circulating) - 1)
+
+    # Calculate detailed monthly unlocks for the first 12 months
+    detailed_unlocks = []
+    for month in range(13):  # 0 to 12 months
+        month_data = {"Month": month}
+        total_unlocked = 0
+
+        # Calculate unlocks for each category
+        for category, category_unlocks in zip(allocations.keys(), scheduled_unlocks):
+            category_unlocked = category_unlocks[month]
+            month_data[category] = category_unlocked
+            total_unlocked += category_unlocked
+
+        month_data["Total Unlocked"] = total_unlocked
+        month_data["Circulating %"] = (total_unlocked / total_supply) * 100
+        detailed_unlocks.append(month_data)
 
-# Convert to DataFrame for easier manipulation
-unlock_df = pd.DataFrame(detailed_unlocks)
+    return {
+        "circulating": circulating,
+        "monthly_shocks": np.array(calculate_supply_shocks(circulating)),
+        "scheduled_unlocks": scheduled_unlocks,
+        # Convert to DataFrame for easier manipulation
+        "unlock_df": pd.DataFrame(detailed_unlocks)
+    }
+
+# Schedule results live in the on-disk result store shared with other dashboard workers and batch jobs;
+# st.cache_data keeps this process from re-reading them on every rerun
+@st.cache_data
+def load_schedule_results(allocations, vesting_schedule, private_sale_tiers, total_supply):
+    schedule_inputs = {
+        "allocations": allocations,
+        "vesting_schedule": vesting_schedule,
+        "private_sale_tiers": private_sale_tiers,
+        "total_supply": total_supply
+    }
+    return cached_result("dashboard_schedule", schedule_inputs, compute_schedule_results)
+
+schedule_results = load_schedule_results(allocations, vesting_schedule, private_sale_tiers, total_supply)
+circulating = unlocked = schedule_results["circulating"]
+monthly_shocks_calculated = list(schedule_results["monthly_shocks"])
+scheduled_unlocks = schedule_results["scheduled_unlocks"]
+unlock_df = schedule_results["unlock_df"]
 
 # Display EDITH tokenomics overview
 st.markdown("## EDITH (ED) Tokenomics Overview")
@@ -385,6 +403,33 @@ with overview_cols[3]:
     </div>
     """, unsafe_allow_html=True)
 
+# --- UPCOMING UNLOCKS FEED ---
+st.markdown("### Upcoming Unlocks")
+
+# Months elapsed since TGE; the feed lists the next scheduled events after it
+current_month = max((pd.Timestamp.today().to_period("M") - pd.Timestamp(tge_date).to_period("M")).n, 0)
+upcoming_feed = upcoming_unlocks(
+    compile_segments(allocations, vesting_schedule, private_sale_tiers),
+    current_month,
+    count=8
+)
+upcoming_df = pd.DataFrame([
+    {
+        "Month": f"Month {event['Month']:g}",
+        "Category": event["Category"],
+        "Event": event["Event"],
+        "Tokens": f"{event['Tokens']:,.0f}" + (" / month" if event["Per Month"] else ""),
+        "% of Supply": f"{event['Tokens'] / total_supply * 100:.2f}%"
+    }
+    for event in upcoming_feed
+])
+st.markdown(f"Month {current_month} since TGE")
+st.dataframe(
+    upcoming_df,
+    hide_index=True,
+    use_container_width=True
+)
+
 # Create a clean layout with columns
 col1, col2 = st.columns(2)
 
@@ -546,6 +591,75 @@ with col2:
     
     st.plotly_chart(fig_supply, use_container_width=True)
 
+# --- HOLDER CONCENTRATION CHART ---
+# Wallet shares are drawn and sorted once per schedule; each month only rescales vesting buckets
+@st.cache_data
+def load_holder_concentration(allocations, vesting_schedule, private_sale_tiers, holder_population, months):
+    def compute_concentration():
+        holders = build_holder_buckets(allocations, vesting_schedule, private_sale_tiers, holder_population, months)
+        return calculate_concentration(holders, top_n=(10, 100))
+
+    concentration_inputs = {
+        "allocations": allocations,
+        "vesting_schedule": vesting_schedule,
+        "private_sale_tiers": private_sale_tiers,
+        "holder_population": holder_population,
+        "months": months
+    }
+    return cached_result("holder_concentration", concentration_inputs, compute_concentration)
+
+with col2:
+    st.markdown("### Holder Concentration")
+
+    concentration = load_holder_concentration(allocations, vesting_schedule, private_sale_tiers, holder_population, 48)
+    concentration_months = list(range(len(concentration["gini"])))
+
+    fig_concentration = make_subplots(specs=[[{"secondary_y": True}]])
+    fig_concentration.add_trace(go.Scatter(
+        x=concentration_months,
+        y=concentration["gini"] * 100,
+        mode='lines',
+        name='Gini (x100)',
+        line=dict(color='#FFFFFF', width=2),
+        hovertemplate="Month %{x}<br>Gini: %{y:.1f}<extra></extra>"
+    ))
+    fig_concentration.add_trace(go.Scatter(
+        x=concentration_months,
+        y=concentration["top_10_share"],
+        mode='lines',
+        name='Top 10 Share (%)',
+        line=dict(color='rgba(170,170,170,0.9)', width=2, dash='dash'),
+        hovertemplate="Month %{x}<br>Top 10: %{y:.1f}%<extra></extra>"
+    ))
+    fig_concentration.add_trace(go.Scatter(
+        x=concentration_months,
+        y=concentration["top_100_share"],
+        mode='lines',
+        name='Top 100 Share (%)',
+        line=dict(color='rgba(170,170,170,0.6)', width=2, dash='dot'),
+        hovertemplate="Month %{x}<br>Top 100: %{y:.1f}%<extra></extra>"
+    ))
+    fig_concentration.add_trace(go.Bar(
+        x=concentration_months,
+        y=concentration["nakamoto"],
+        name='Nakamoto Coefficient',
+        marker_color='rgba(255,100,100,0.3)',
+        hovertemplate="Month %{x}<br>Nakamoto: %{y:.0f} wallets<extra></extra>"
+    ), secondary_y=True)
+    fig_concentration.update_layout(
+        xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+        yaxis=dict(title="Gini / Share (%)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+        yaxis2=dict(title="Wallets", showgrid=False, zeroline=False),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+        hovermode='x unified',
+        margin=dict(t=0, b=0, l=0, r=0),
+        height=300
+    )
+    st.plotly_chart(fig_concentration, use_container_width=True)
+
 # --- INVESTOR ROUNDS CHART ---
 st.markdown("### Investment Metrics")
 col3, col4 = st.columns(2)
@@ -807,6 +921,476 @@ st.dataframe(
     use_container_width=True
 )
 
+# --- ALLOCATION WHAT-IF EXPLORER ---
+st.markdown("### Allocation What-If Explorer")
+
+# Per-token basis curves only depend on the schedule structure, so slider drags never rebuild them
+@st.cache_data
+def load_unlock_basis(allocations, vesting_schedule, private_sale_tiers, months):
+    return calculate_unlock_basis(allocations, vesting_schedule, private_sale_tiers, months)
+
+what_if_basis = load_unlock_basis(allocations, vesting_schedule, private_sale_tiers, 240)
+
+# Sliders rerun only this fragment, so a drag costs one matrix-vector product instead of a full page rerun
+@st.fragment
+def render_what_if_explorer():
+    with st.expander("Adjust allocation shares and horizon"):
+        what_if_horizon = st.slider("Horizon (months)", min_value=12, max_value=240, value=48, step=12)
+        share_cols = st.columns(4)
+        what_if_shares = []
+        for i, (category, tokens) in enumerate(allocations.items()):
+            with share_cols[i % 4]:
+                what_if_shares.append(st.slider(
+                    f"{category} (%)",
+                    min_value=0.0,
+                    max_value=60.0,
+                    value=tokens / total_supply * 100,
+                    step=0.5
+                ))
+
+    what_if_start = time.perf_counter()
+    what_if_tokens = np.array(what_if_shares) / 100 * total_supply
+    what_if_supply, what_if_shocks = apply_allocation_what_if(what_if_basis, what_if_tokens, total_supply, what_if_horizon)
+    baseline_supply, _ = apply_allocation_what_if(what_if_basis, list(allocations.values()), total_supply, what_if_horizon)
+    what_if_ms = (time.perf_counter() - what_if_start) * 1000
+
+    what_if_months = list(range(what_if_horizon + 1))
+    what_if_col1, what_if_col2 = st.columns(2)
+
+    with what_if_col1:
+        fig_what_if = go.Figure()
+        fig_what_if.add_trace(go.Scatter(
+            x=what_if_months,
+            y=baseline_supply,
+            mode='lines',
+            name='Current Allocation',
+            line=dict(color='rgba(255,255,255,0.5)', width=2, dash='dash'),
+            hovertemplate="Month %{x}<br>Current: %{y:.2f}%<extra></extra>"
+        ))
+        fig_what_if.add_trace(go.Scatter(
+            x=what_if_months,
+            y=what_if_supply,
+            mode='lines',
+            name='What-If',
+            line=dict(color='#FFFFFF', width=2),
+            fill='tozeroy',
+            fillcolor='rgba(255,255,255,0.05)',
+            hovertemplate="Month %{x}<br>What-If: %{y:.2f}%<extra></extra>"
+        ))
+        fig_what_if.update_layout(
+            title="Cumulative Circulating Supply",
+            xaxis=dict(title="Months", showgrid=False, zeroline=False),
+            yaxis=dict(title="Supply (%)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font_color='white',
+            legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+            hovermode='x unified',
+            height=300
+        )
+        st.plotly_chart(fig_what_if, use_container_width=True)
+
+    with what_if_col2:
+        fig_what_if_shocks = go.Figure(go.Bar(
+            x=what_if_months[1:],
+            y=what_if_shocks[1:],
+            marker_color=['rgba(255,100,100,0.7)' if x > 5 else 'rgba(255,255,255,0.7)' for x in what_if_shocks[1:]],
+            hovertemplate="Month %{x}<br>Shock: %{y:.2f}%<extra></extra>"
+        ))
+        fig_what_if_shocks.add_hline(y=5, line_dash="dash", line_color="rgba(255,100,100,0.3)", annotation_text="High Risk (>5%)", annotation_position="top right")
+        fig_what_if_shocks.update_layout(
+            title="What-If Monthly Supply Shocks",
+            xaxis_title="Month",
+            yaxis_title="Supply Change (%)",
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            font_color='white',
+            height=300
+        )
+        st.plotly_chart(fig_what_if_shocks, use_container_width=True)
+
+    st.markdown(f"Allocation shares sum to **{sum(what_if_shares):.1f}%** of total supply; "
+                f"what-if recomputed in **{what_if_ms:.1f} ms**.")
+
+render_what_if_explorer()
+
+# --- ON-CHAIN CLAIMS VS SCHEDULE ---
+st.markdown("### On-Chain Claims vs Schedule")
+
+# Claim log location (CSV, JSONL or Parquet with wallet, category, timestamp, amount columns)
+claim_log_path = st.sidebar.text_input("Claim event log", value="")
+claim_checkpoint_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".claim_checkpoints")
+
+if claim_log_path and os.path.exists(claim_log_path):
+    # Checkpoint in the dashboard's own directory (the log's may be read-only) so reruns only stream
+    # newly appended events
+    os.makedirs(claim_checkpoint_dir, exist_ok=True)
+    claim_checkpoint_name = hashlib.sha256(os.path.abspath(claim_log_path).encode()).hexdigest()[:16]
+    claim_replay = replay_claim_log(
+        claim_log_path,
+        list(allocations.keys()),
+        tge_date,
+        months=len(circulating) - 1,
+        checkpoint_path=os.path.join(claim_checkpoint_dir, claim_checkpoint_name + ".checkpoint.npz")
+    )
+    claims_df = compare_claims_with_schedule(claim_replay["claimed"], scheduled_unlocks, total_supply)
+
+    fig_claims = make_subplots(specs=[[{"secondary_y": True}]])
+    fig_claims.add_trace(go.Scatter(
+        x=claims_df["Month"],
+        y=claims_df["Scheduled Circulating %"],
+        mode='lines',
+        name='Scheduled Circulating',
+        line=dict(color='rgba(255,255,255,0.5)', width=2, dash='dash'),
+        hovertemplate="Month %{x}<br>Scheduled: %{y:.2f}%<extra></extra>"
+    ))
+    fig_claims.add_trace(go.Scatter(
+        x=claims_df["Month"],
+        y=claims_df["Actual Circulating %"],
+        mode='lines',
+        name='Actual Circulating (Claimed)',
+        line=dict(color='#FFFFFF', width=2),
+        hovertemplate="Month %{x}<br>Claimed: %{y:.2f}%<extra></extra>"
+    ))
+    fig_claims.add_trace(go.Bar(
+        x=claims_df["Month"],
+        y=claims_df["Actual Shock %"],
+        name='Actual Shock',
+        marker_color=['rgba(255,100,100,0.5)' if x > 5 else 'rgba(170,170,170,0.3)' for x in claims_df["Actual Shock %"]],
+        hovertemplate="Month %{x}<br>Actual Shock: %{y:.1f}%<extra></extra>"
+    ), secondary_y=True)
+    fig_claims.update_layout(
+        xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+        yaxis=dict(title="Cumulative Supply (%)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+        yaxis2=dict(title="Shock (%)", showgrid=False, zeroline=False),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+        hovermode='x unified',
+        margin=dict(t=30, b=0, l=0, r=0),
+        height=300
+    )
+    st.plotly_chart(fig_claims, use_container_width=True)
+
+    st.markdown(f"Replayed **{claim_replay['rows']:,}** claim events "
+                f"({claim_replay['dropped']:,} outside the tracked categories or horizon).")
+else:
+    st.markdown("Set a claim event log in the sidebar to compare actual claims against the modeled schedule.")
+
+# --- REALIZED SUPPLY (CLAIM & SELL BEHAVIOR) ---
+st.markdown("### Realized Supply (Claim & Sell Behavior)")
+
+# Monte Carlo over per-category claim and sell delays around the claim_behavior means
+behavior = simulate_claim_behavior(
+    np.random.default_rng(42),
+    scheduled_unlocks,
+    claim_behavior,
+    list(allocations.keys()),
+    total_supply,
+    n_paths=500
+)
+scheduled_supply = calculate_cumulative_supply(scheduled_unlocks, total_supply)
+behavior_months = list(range(len(scheduled_supply)))
+realized_p5, realized_p50, realized_p95 = np.percentile(behavior["realized_supply"], [5, 50, 95], axis=0)
+liquid_p5, liquid_p50, liquid_p95 = np.percentile(behavior["liquid_supply"], [5, 50, 95], axis=0)
+
+fig_behavior = go.Figure()
+fig_behavior.add_trace(go.Scatter(
+    x=behavior_months,
+    y=scheduled_supply,
+    mode='lines',
+    name='Unlocked (Schedule)',
+    line=dict(color='rgba(255,255,255,0.5)', width=2, dash='dash'),
+    hovertemplate="Month %{x}<br>Unlocked: %{y:.2f}%<extra></extra>"
+))
+for name, low, mid, high, color in [
+    ("Realized Circulating (Claimed)", realized_p5, realized_p50, realized_p95, '255,255,255'),
+    ("Liquid (Sold)", liquid_p5, liquid_p50, liquid_p95, '255,100,100'),
+]:
+    fig_behavior.add_trace(go.Scatter(
+        x=behavior_months + behavior_months[::-1],
+        y=list(high) + list(low[::-1]),
+        fill='toself',
+        fillcolor=f'rgba({color},0.1)',
+        line=dict(width=0),
+        hoverinfo='skip',
+        showlegend=False
+    ))
+    fig_behavior.add_trace(go.Scatter(
+        x=behavior_months,
+        y=mid,
+        mode='lines',
+        name=name,
+        line=dict(color=f'rgba({color},0.9)', width=2),
+        hovertemplate="Month %{x}<br>" + name + ": %{y:.2f}%<extra></extra>"
+    ))
+fig_behavior.update_layout(
+    xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+    yaxis=dict(title="Cumulative Supply (%)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font_color='white',
+    legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+    hovermode='x unified',
+    margin=dict(t=30, b=0, l=0, r=0),
+    height=300
+)
+st.plotly_chart(fig_behavior, use_container_width=True)
+
+st.markdown(f"Median realized shock peaks at **{np.median(behavior['realized_shocks'][:, 1:].max(axis=1)):.1f}%** "
+            f"versus **{calculate_shock_series(scheduled_supply)[1:].max():.1f}%** on the unlock schedule "
+            "(bands show the 5th-95th percentile over 500 simulated paths).")
+
+# --- UNLOCK SELL PRESSURE & PRICE IMPACT ---
+st.markdown("### Unlock Sell Pressure & Price Impact")
+
+# Constant-product pool seeded with the Exchange & Liquidity TGE tranche at the Launchpad price;
+# later Exchange & Liquidity unlocks are paired into the pool at spot
+liquidity_row = scheduled_unlocks[list(allocations.keys()).index("Exchange & Liquidity")]
+launch_price = investor_rounds["Launchpad"]["price_per_token"]
+sell_flow = behavior["sold"].sum(axis=-2)
+price_impact = simulate_price_impact(
+    sell_flow,
+    liquidity_row[0],
+    launch_price,
+    total_supply,
+    buy_flow=sample_buy_demand(
+        np.random.default_rng(7),
+        amm_settings["monthly_buy_demand"],
+        amm_settings["demand_volatility"],
+        sell_flow.shape
+    ),
+    liquidity_adds=np.concatenate([[0], liquidity_row[1:]]),
+    fee=amm_settings["fee"]
+)
+price_p5, price_p50, price_p95 = np.percentile(price_impact["price"], [5, 50, 95], axis=0)
+
+amm_cols = st.columns(3)
+with amm_cols[0]:
+    st.markdown(f"""
+    <div class="kpi-card">
+        <div class="kpi-title">Median Price at Month {behavior_months[-1]}</div>
+        <div class="kpi-value">${price_p50[-1]:.4f}</div>
+        <div class="kpi-subtitle">vs ${launch_price:.3f} Launchpad price</div>
+    </div>
+    """, unsafe_allow_html=True)
+with amm_cols[1]:
+    st.markdown(f"""
+    <div class="kpi-card">
+        <div class="kpi-title">Median FDV at Month {behavior_months[-1]}</div>
+        <div class="kpi-value">${np.median(price_impact["fdv"][:, -1]) / 1_000_000:,.1f}M</div>
+        <div class="kpi-subtitle">5th-95th: ${price_p5[-1] * total_supply / 1_000_000:,.1f}M - ${price_p95[-1] * total_supply / 1_000_000:,.1f}M</div>
+    </div>
+    """, unsafe_allow_html=True)
+with amm_cols[2]:
+    st.markdown(f"""
+    <div class="kpi-card">
+        <div class="kpi-title">Median Worst-Month Slippage</div>
+        <div class="kpi-value">{np.median(price_impact["slippage"].max(axis=1)):.1f}%</div>
+        <div class="kpi-subtitle">Unlock sells vs pre-trade spot price</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+fig_price = make_subplots(specs=[[{"secondary_y": True}]])
+fig_price.add_trace(go.Scatter(
+    x=behavior_months + behavior_months[::-1],
+    y=list(price_p95) + list(price_p5[::-1]),
+    fill='toself',
+    fillcolor='rgba(255,255,255,0.1)',
+    line=dict(width=0),
+    hoverinfo='skip',
+    showlegend=False
+))
+fig_price.add_trace(go.Scatter(
+    x=behavior_months,
+    y=price_p50,
+    mode='lines',
+    name='Median Price',
+    line=dict(color='#FFFFFF', width=2),
+    hovertemplate="Month %{x}<br>Price: $%{y:.4f}<extra></extra>"
+))
+fig_price.add_trace(go.Bar(
+    x=behavior_months,
+    y=np.median(sell_flow, axis=0) / 1_000_000,
+    name='Median Sell Flow (M ED)',
+    marker_color='rgba(255,100,100,0.3)',
+    hovertemplate="Month %{x}<br>Sold: %{y:.1f}M ED<extra></extra>"
+), secondary_y=True)
+fig_price.update_layout(
+    xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+    yaxis=dict(title="Price ($, log)", type='log', showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+    yaxis2=dict(title="Sell Flow (M ED)", showgrid=False, zeroline=False),
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+    font_color='white',
+    legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+    hovermode='x unified',
+    margin=dict(t=30, b=0, l=0, r=0),
+    height=300
+)
+st.plotly_chart(fig_price, use_container_width=True)
+
+# --- MONTE CARLO PRICE PATHS ---
+st.markdown("### Monte Carlo Price Paths")
+
+monte_carlo_cols = st.columns(2)
+with monte_carlo_cols[0]:
+    monte_carlo_paths = st.selectbox("Paths", [10_000, 100_000, 1_000_000], format_func=lambda n: f"{n:,}")
+with monte_carlo_cols[1]:
+    monte_carlo_workers = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1, value=os.cpu_count() or 1)
+
+# Same end-to-end pipeline as the price impact section, sharded across processes
+price_path_params = {
+    "unlocks": scheduled_unlocks,
+    "behavior": claim_behavior,
+    "categories": list(allocations.keys()),
+    "total_supply": total_supply,
+    "seed_tokens": liquidity_row[0],
+    "seed_price": launch_price,
+    "liquidity_adds": np.concatenate([[0], liquidity_row[1:]]),
+    "monthly_buy_demand": amm_settings["monthly_buy_demand"],
+    "demand_volatility": amm_settings["demand_volatility"],
+    "fee": amm_settings["fee"]
+}
+
+if st.checkbox("Run Monte Carlo price paths"):
+    monte_carlo = run_monte_carlo(
+        simulate_price_paths,
+        monte_carlo_paths,
+        len(behavior_months),
+        price_path_params,
+        n_workers=int(monte_carlo_workers),
+        percentiles=(5, 25, 50, 75, 95)
+    )
+    mc_p5, mc_p25, mc_p50, mc_p75, mc_p95 = monte_carlo["bands"]
+
+    fig_monte_carlo = go.Figure()
+    for low, high, opacity in [(mc_p5, mc_p95, 0.08), (mc_p25, mc_p75, 0.15)]:
+        fig_monte_carlo.add_trace(go.Scatter(
+            x=behavior_months + behavior_months[::-1],
+            y=list(high) + list(low[::-1]),
+            fill='toself',
+            fillcolor=f'rgba(255,255,255,{opacity})',
+            line=dict(width=0),
+            hoverinfo='skip',
+            showlegend=False
+        ))
+    fig_monte_carlo.add_trace(go.Scatter(
+        x=behavior_months,
+        y=mc_p50,
+        mode='lines',
+        name='Median Price',
+        line=dict(color='#FFFFFF', width=2),
+        hovertemplate="Month %{x}<br>Price: $%{y:.4f}<extra></extra>"
+    ))
+    fig_monte_carlo.update_layout(
+        xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+        yaxis=dict(title="Price ($, log)", type='log', showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        hovermode='x unified',
+        margin=dict(t=30, b=0, l=0, r=0),
+        height=300
+    )
+    st.plotly_chart(fig_monte_carlo, use_container_width=True)
+    st.markdown(f"{monte_carlo_paths:,} paths on {monte_carlo['n_workers']} worker(s) in "
+                f"**{monte_carlo['elapsed']:.2f}s** (bands: 5th-95th and 25th-75th percentile).")
+
+    if st.checkbox("Measure scaling efficiency per core count"):
+        core_counts = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= (os.cpu_count() or 1)]
+        scaling_df = pd.DataFrame(benchmark_scaling(
+            simulate_price_paths,
+            monte_carlo_paths,
+            len(behavior_months),
+            price_path_params,
+            worker_counts=core_counts
+        ))
+        scaling_df["Seconds"] = scaling_df["Seconds"].apply(lambda x: f"{x:.2f}")
+        scaling_df["Speedup"] = scaling_df["Speedup"].apply(lambda x: f"{x:.2f}x")
+        scaling_df["Efficiency"] = scaling_df["Efficiency"].apply(lambda x: f"{x:.0%}")
+        st.dataframe(scaling_df, hide_index=True, use_container_width=True)
+
+# --- TREASURY RUNWAY ---
+st.markdown("### Treasury Runway")
+
+treasury_row = scheduled_unlocks[list(allocations.keys()).index("Treasury")]
+# Forced sales land on the median liquid supply from the claim & sell behavior section
+treasury_baseline_supply = np.median(behavior["liquid_supply"], axis=0) / 100 * total_supply
+
+# Plan edits rerun only this fragment; every plan is evaluated across all price paths in one array op
+@st.fragment
+def render_treasury_runway():
+    with st.expander("Adjust spend plans"):
+        plan_cols = st.columns(len(treasury_spend_plans))
+        spend_plans = {}
+        for i, (plan_name, plan) in enumerate(treasury_spend_plans.items()):
+            with plan_cols[i]:
+                st.markdown(f"**{plan_name}**")
+                spend_plans[plan_name] = {
+                    "monthly_burn": st.number_input(f"{plan_name} monthly burn ($)", min_value=0, value=plan["monthly_burn"], step=10_000),
+                    "grants": plan["grants"],
+                    "fiat_reserve": st.number_input(f"{plan_name} fiat reserve ($)", min_value=0, value=plan["fiat_reserve"], step=100_000)
+                }
+
+    runway_start = time.perf_counter()
+    runway = simulate_treasury_runway(spend_plans, treasury_row, price_impact["price"], treasury_baseline_supply)
+    runway_ms = (time.perf_counter() - runway_start) * 1000
+
+    runway_df = pd.DataFrame({
+        "Plan": list(spend_plans.keys()),
+        "Median Runway (Months)": np.median(runway["runway"], axis=1),
+        "5th Percentile Runway (Months)": np.percentile(runway["runway"], 5, axis=1),
+        "Median Tokens Sold (M ED)": np.median(runway["tokens_sold"][..., -1], axis=1) / 1_000_000,
+        "Median Proceeds ($M)": np.median(runway["proceeds"].sum(axis=-1), axis=1) / 1_000_000,
+        "Median Worst Extra Shock (%)": np.median(runway["extra_shock"].max(axis=-1), axis=1)
+    })
+    runway_months_max = len(behavior_months)
+    runway_df["Median Runway (Months)"] = runway_df["Median Runway (Months)"].apply(lambda x: f"{x:.0f}" if x < runway_months_max else f"{runway_months_max - 1}+")
+    runway_df["5th Percentile Runway (Months)"] = runway_df["5th Percentile Runway (Months)"].apply(lambda x: f"{x:.0f}" if x < runway_months_max else f"{runway_months_max - 1}+")
+    runway_df["Median Tokens Sold (M ED)"] = runway_df["Median Tokens Sold (M ED)"].apply(lambda x: f"{x:.1f}")
+    runway_df["Median Proceeds ($M)"] = runway_df["Median Proceeds ($M)"].apply(lambda x: f"${x:.2f}M")
+    runway_df["Median Worst Extra Shock (%)"] = runway_df["Median Worst Extra Shock (%)"].apply(lambda x: f"{x:.2f}%")
+    st.dataframe(runway_df, hide_index=True, use_container_width=True)
+
+    fig_runway = go.Figure()
+    fig_runway.add_trace(go.Scatter(
+        x=behavior_months,
+        y=np.cumsum(treasury_row) / 1_000_000,
+        mode='lines',
+        name='Vested Treasury',
+        line=dict(color='rgba(255,255,255,0.5)', width=2, dash='dash'),
+        hovertemplate="Month %{x}<br>Vested: %{y:.1f}M ED<extra></extra>"
+    ))
+    for i, plan_name in enumerate(spend_plans):
+        fig_runway.add_trace(go.Scatter(
+            x=behavior_months,
+            y=np.median(runway["tokens_sold"][i], axis=0) / 1_000_000,
+            mode='lines',
+            name=f'{plan_name} Sold (Median)',
+            line=dict(color=f'rgba(255,255,255,{1 - i * 0.3:.1f})', width=2),
+            hovertemplate=f"Month %{{x}}<br>{plan_name}: %{{y:.1f}}M ED<extra></extra>"
+        ))
+    fig_runway.update_layout(
+        title="Cumulative Forced Treasury Sales vs Vested Tokens",
+        xaxis=dict(title="Months", showgrid=False, zeroline=False, dtick=6),
+        yaxis=dict(title="Tokens (M ED)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        legend=dict(orientation="h", yanchor="top", y=1.02, xanchor="right", x=1, font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+        hovermode='x unified',
+        margin=dict(t=30, b=0, l=0, r=0),
+        height=300
+    )
+    st.plotly_chart(fig_runway, use_container_width=True)
+    st.markdown(f"{len(spend_plans)} plans x {runway['runway'].shape[1]:,} price paths recomputed in **{runway_ms:.1f} ms**. "
+                "Runway ends in the first month the vested Treasury cannot cover spend beyond the fiat reserve; "
+                "extra shock is forced sales as a share of the prior month's liquid supply.")
+
+render_treasury_runway()
+
 # --- VESTING SCHEDULES SECTION ---
 st.markdown("### Vesting Schedules")
 
@@ -897,6 +1481,83 @@ fig_vesting.update_layout(
 
 st.plotly_chart(fig_vesting, use_container_width=True)
 
+# --- UNLOCK SCHEDULE SOLVER ---
+st.markdown("### Unlock Schedule Solver")
+
+solver_cols = st.columns(4)
+with solver_cols[0]:
+    solver_max_shock = st.number_input("Max monthly shock (%)", min_value=0.5, max_value=50.0, value=5.0, step=0.5)
+with solver_cols[1]:
+    solver_min_float = st.number_input("Min TGE float (%)", min_value=0.0, max_value=100.0, value=round(tge_circulating, 2), step=0.5)
+with solver_cols[2]:
+    solver_objective = st.selectbox("Objective", ["fastest", "smoothest"])
+with solver_cols[3]:
+    solver_months = st.number_input("Horizon (months)", min_value=12, max_value=480, value=240, step=12)
+
+if st.checkbox("Solve unlock schedule"):
+    # Cliffs and TGE caps come from the current vesting schedule; the solver picks the release curve
+    solver_constraints = {
+        category: {"cliff": schedule["cliff"], "max_tge": schedule["tge"]}
+        for category, schedule in vesting_schedule.items()
+    }
+    try:
+        solved = solve_unlock_schedule(
+            allocations,
+            solver_constraints,
+            months=int(solver_months),
+            max_shock=solver_max_shock,
+            min_tge_float=solver_min_float,
+            objective=solver_objective
+        )
+    except ValueError as error:
+        st.markdown(f"**{error}**")
+    else:
+        solver_months_range = list(range(int(solver_months) + 1))
+        solver_col1, solver_col2 = st.columns(2)
+
+        with solver_col1:
+            fig_solved = go.Figure()
+            for category, row in zip(solved["categories"], solved["unlocks"]):
+                fig_solved.add_trace(go.Scatter(
+                    x=solver_months_range,
+                    y=np.cumsum(row) / total_supply * 100,
+                    mode='lines',
+                    name=category,
+                    stackgroup='supply',
+                    line=dict(width=0.5),
+                    hovertemplate="Month %{x}<br>" + category + ": %{y:.2f}%<extra></extra>"
+                ))
+            fig_solved.update_layout(
+                title="Solved Cumulative Supply by Category",
+                xaxis=dict(title="Months", showgrid=False, zeroline=False),
+                yaxis=dict(title="Supply (%)", showgrid=True, gridcolor='rgba(255,255,255,0.05)', zeroline=False),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font_color='white',
+                legend=dict(font=dict(size=10), bgcolor='rgba(0,0,0,0)'),
+                height=300
+            )
+            st.plotly_chart(fig_solved, use_container_width=True)
+
+        with solver_col2:
+            fig_solved_shocks = go.Figure(go.Bar(
+                x=solver_months_range[1:],
+                y=solved["shocks"][1:],
+                marker_color=['rgba(255,100,100,0.7)' if x > solver_max_shock + 1e-6 else 'rgba(255,255,255,0.7)' for x in solved["shocks"][1:]],
+                hovertemplate="Month %{x}<br>Shock: %{y:.2f}%<extra></extra>"
+            ))
+            fig_solved_shocks.add_hline(y=solver_max_shock, line_dash="dash", line_color="rgba(255,100,100,0.3)", annotation_text=f"Shock Target ({solver_max_shock:g}%)", annotation_position="top right")
+            fig_solved_shocks.update_layout(
+                title="Solved Monthly Supply Shocks",
+                xaxis_title="Month",
+                yaxis_title="Supply Change (%)",
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                font_color='white',
+                height=300
+            )
+            st.plotly_chart(fig_solved_shocks, use_container_width=True)
+
 # --- MITIGATION STRATEGIES SECTION ---
 st.markdown("### Supply Shock Mitigation Strategies")
 
@@ -0,0 +1,58 @@
+import numpy as np
+
+
+# Function to lay out spend plans as a plans x periods array of USD outflows
+# plan: {"monthly_burn": USD from month 1, "grants": {month: USD}, "fiat_reserve": USD on hand at TGE}
+def build_spend_schedule(spend_plans, n_periods):
+    spend = np.zeros((len(spend_plans), n_periods))
+    for row, plan in enumerate(spend_plans.values()):
+        spend[row, 1:] = plan.get("monthly_burn", 0)
+        for month, amount in plan.get("grants", {}).items():
+            if int(month) < n_periods:
+                spend[row, int(month)] += amount
+    return spend
+
+
+# Function to fund spend plans by selling vested Treasury tokens along price paths
+# treasury_unlocks (periods,), price_paths (paths, periods); baseline_supply (periods,) is the circulating
+# supply (tokens) the forced sales land on. Unfunded spend carries forward in USD and is converted at each
+# month's own price, so one loop over periods is vectorized across every plan x path.
+def simulate_treasury_runway(spend_plans, treasury_unlocks, price_paths, baseline_supply):
+    price_paths = np.asarray(price_paths, dtype=float)
+    n_periods = price_paths.shape[-1]
+    spend = build_spend_schedule(spend_plans, n_periods)[:, None, :]
+    reserves = np.array([plan.get("fiat_reserve", 0) for plan in spend_plans.values()], dtype=float)[:, None, None]
+
+    # Fiat reserve pays first; whatever it cannot cover must come from token sales
+    uncovered = np.maximum(np.cumsum(spend, axis=-1) - reserves, 0)
+    usd_from_tokens = np.diff(uncovered, prepend=0, axis=-1)
+    tokens_vested = np.cumsum(treasury_unlocks)
+
+    batch_shape = (len(spend_plans),) + price_paths.shape[:-1]
+    forced_sales = np.zeros(batch_shape + (n_periods,))
+    unfunded_usd = np.zeros(batch_shape + (n_periods,))
+    owed, sold = np.zeros(batch_shape), np.zeros(batch_shape)
+    for t in range(n_periods):
+        owed = owed + usd_from_tokens[..., t]
+        price = price_paths[..., t]
+        sell = np.minimum(owed / price, tokens_vested[t] - sold)
+        sold = sold + sell
+        owed = np.maximum(owed - sell * price, 0)
+        forced_sales[..., t] = sell
+        unfunded_usd[..., t] = owed
+
+    # Runway ends in the first month the vested Treasury cannot cover what is owed
+    short = unfunded_usd > 1e-6
+    runway = np.where(short.any(axis=-1), short.argmax(axis=-1), n_periods)
+
+    previous_supply = np.asarray(baseline_supply, dtype=float)[:-1]
+    extra_shock = np.zeros(forced_sales.shape)
+    np.divide(forced_sales[..., 1:] * 100, previous_supply, out=extra_shock[..., 1:], where=previous_supply > 0)
+    return {
+        "runway": runway,
+        "forced_sales": forced_sales,
+        "tokens_sold": np.cumsum(forced_sales, axis=-1),
+        "proceeds": forced_sales * price_paths,
+        "unfunded_usd": unfunded_usd,
+        "extra_shock": extra_shock,
+    }
@@ -0,0 +1,91 @@
+import heapq
+
+import numpy as np
+
+from supply_engine import calculate_shock_series
+
+# Event kinds emitted from schedule segments
+LUMP = "Unlock"
+STREAM_START = "Vesting starts"
+STREAM_END = "Vesting ends"
+
+
+# Function to turn schedule segments into a heap-ordered timeline of discrete events
+# Each event is (time, sequence, kind, segment index, tokens); stream events carry the monthly rate
+def build_unlock_events(segments):
+    events = []
+    for i in range(len(segments["owner"])):
+        start, end = segments["start"][i], segments["end"][i]
+        rate, lump, decay = segments["rate"][i], segments["lump"][i], segments["decay"][i]
+        if lump > 0:
+            events.append((start, len(events), LUMP, i, lump))
+        if rate != 0 and end > start:
+            events.append((start, len(events), STREAM_START, i, rate))
+            events.append((end, len(events), STREAM_END, i, rate * np.exp(-decay * (end - start))))
+    heapq.heapify(events)
+    return events
+
+
+# Function to integrate the active streams forward by elapsed months from the current time
+def advance_streams(flat_rate, decaying, now, elapsed):
+    released = flat_rate * elapsed
+    for rate, decay, start in decaying.values():
+        released = released + rate * np.exp(-decay * (now - start)) * -np.expm1(-decay * elapsed) / decay
+    return released
+
+
+# Function to produce cumulative supply (%) and shocks by jumping from event to event
+# Between events the active streams are advanced analytically, so work scales with the number of events
+def calculate_event_supply(segments, months, total_supply):
+    queue = build_unlock_events(segments)
+    sample_times = np.arange(months + 1, dtype=float)
+    cumulative = np.zeros(months + 1)
+    level, now, flat_rate, decaying = 0.0, 0.0, 0.0, {}
+    next_sample = 0
+
+    while next_sample <= months:
+        event_time = queue[0][0] if queue else np.inf
+        # Samples before the next event only see the streams already running
+        upto = int(np.searchsorted(sample_times, event_time, side="left"))
+        if upto > next_sample:
+            cumulative[next_sample:upto] = level + advance_streams(flat_rate, decaying, now, sample_times[next_sample:upto] - now)
+            next_sample = upto
+        if not queue or event_time > months:
+            break
+
+        level += advance_streams(flat_rate, decaying, now, event_time - now)
+        now = event_time
+        while queue and queue[0][0] == event_time:
+            _, _, kind, i, tokens = heapq.heappop(queue)
+            decay = segments["decay"][i]
+            if kind == LUMP:
+                level += tokens
+            elif kind == STREAM_START and decay == 0:
+                flat_rate += tokens
+            elif kind == STREAM_START:
+                decaying[i] = (tokens, decay, now)
+            elif decay == 0:
+                flat_rate -= tokens
+            else:
+                del decaying[i]
+
+    supply = cumulative / total_supply * 100
+    return supply, calculate_shock_series(supply)
+
+
+# Function to list the next unlock events after a given month, optionally only the big ones
+def upcoming_unlocks(segments, after_month, count=8, min_tokens=0):
+    queue = build_unlock_events(segments)
+    feed = []
+    while queue and len(feed) < count:
+        time, _, kind, i, tokens = heapq.heappop(queue)
+        if time <= after_month or tokens < min_tokens:
+            continue
+        feed.append({
+            "Month": float(time),
+            "Category": segments["labels"][i],
+            "Event": kind,
+            "Tokens": float(tokens),
+            "Per Month": kind != LUMP,
+        })
+    return feed
@@ -0,0 +1,54 @@
+import numpy as np
+
+# Vesting curves are declared as data on each vesting_schedule entry via a "curve" key.
+# Every curve shares "tge" (% of allocation at month 0) and most use "cliff" and "vesting_period" (months):
+#   linear             equal monthly releases over the vesting period after the cliff
+#   catch_up           linear, plus the months accrued during the cliff released in the first month after it
+#   fixed_rate         a fixed "rate" (tokens/month) from month "start" until the vesting period ends
+#   stepped            equal releases every "step" months over the vesting period
+#   exponential_decay  continuous release decaying with "half_life" months, normalized over the vesting period
+#   milestone          lumps at given months: "milestones": [{"month": 6, "percent": 20}, ...]
+#   piecewise          custom cumulative curve: "points": [[month, cumulative % of allocation], ...]
+#   tiered             one fixed_rate bucket per private sale tier (expanded by expand_vesting_buckets)
+# Each curve is implemented once, as schedule segments in vesting_segments.py.
+
+
+# Month-valued parameters; "positive" ones must also be non-zero
+MONTH_PARAMS = ("cliff", "start", "vesting_period", "step", "half_life")
+POSITIVE_MONTH_PARAMS = ("vesting_period", "step", "half_life")
+
+
+# Function to validate a curve spec and cast its month parameters (which may arrive as JSON floats) to float
+# Months may be fractional: a release at month 2.5 lands in month 3, the period covering (2, 3]
+def normalize_curve_spec(spec):
+    spec = dict(spec)
+    for name in MONTH_PARAMS:
+        if name in spec:
+            value = float(spec[name])
+            positive = name in POSITIVE_MONTH_PARAMS
+            if not np.isfinite(value) or value < 0 or (positive and value == 0):
+                kind = "positive" if positive else "non-negative"
+                raise ValueError(f"Vesting curve parameter '{name}' must be a {kind} number of months, got {spec[name]!r}")
+            spec[name] = value
+    if "milestones" in spec:
+        spec["milestones"] = [dict(milestone, month=float(milestone["month"])) for milestone in spec["milestones"]]
+    return spec
+
+
+# Function to flatten categories into curve buckets (row, tokens, spec); tiered categories expand per tier
+def expand_vesting_buckets(allocations, vesting_schedule, private_sale_tiers=None):
+    buckets = []
+    for row, (category, tokens) in enumerate(allocations.items()):
+        spec = vesting_schedule[category]
+        if spec.get("curve") == "tiered":
+            for tier_name, tier in private_sale_tiers.items():
+                buckets.append((row, tier["allocation"], normalize_curve_spec({
+                    "curve": "fixed_rate",
+                    "tier": tier_name,
+                    "tge": tier["tge"],
+                    "vesting_period": tier["vesting_period"],
+                    "rate": tier["monthly_unlock"],
+                })))
+        else:
+            buckets.append((row, tokens, normalize_curve_spec(spec)))
+    return buckets
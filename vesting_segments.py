@@ -0,0 +1,162 @@
+import numpy as np
+
+from vesting_curves import expand_vesting_buckets
+
+# A schedule is stored as segments instead of a dense month grid. Each segment releases
+# "lump" tokens at time "start" and then streams rate * exp(-decay * (t - start)) tokens per month
+# over (start, end]. Times are in months and may be fractional, so any resolution can be queried.
+# Month m of the dense schedule is the release over (m - 1, m]. This is the only implementation of
+# the vesting curves declared in vesting_curves.py; supply_engine.calculate_unlock_matrix densifies it.
+
+
+# Segment builders: (tokens, spec) -> list of (start, end, rate, lump, decay)
+def linear_segments(tokens, spec):
+    tge = spec.get("tge", 0) / 100
+    cliff = spec.get("cliff", 0)
+    vesting_period = spec.get("vesting_period", 1)
+    return [
+        (0, 0, 0, tokens * tge, 0),
+        (cliff, cliff + vesting_period, tokens * (1 - tge) / vesting_period, 0, 0),
+    ]
+
+
+def catch_up_segments(tokens, spec):
+    cliff = spec.get("cliff", 0)
+    rate = tokens * (1 - spec.get("tge", 0) / 100) / spec.get("vesting_period", 1)
+    return linear_segments(tokens, spec) + [(cliff + 1, cliff + 1, 0, rate * cliff, 0)]
+
+
+def fixed_rate_segments(tokens, spec):
+    tge = spec.get("tge", 0) / 100
+    cliff = spec.get("cliff", 0)
+    vesting_period = spec.get("vesting_period", 1)
+    start = max(spec.get("start", cliff + 1), 1)
+    rate = spec.get("rate", tokens * (1 - tge) / vesting_period)
+    return [(0, 0, 0, tokens * tge, 0), (start - 1, max(cliff + vesting_period, start - 1), rate, 0, 0)]
+
+
+def stepped_segments(tokens, spec):
+    tge = spec.get("tge", 0) / 100
+    cliff = spec.get("cliff", 0)
+    vesting_period = spec.get("vesting_period", 1)
+    step = spec.get("step", 1)
+    # Releases land every step months, with the last one on the final vesting month
+    steps = np.append(np.arange(1, np.ceil(vesting_period / step)) * step, vesting_period)
+    amount = tokens * (1 - tge) / len(steps)
+    return [(0, 0, 0, tokens * tge, 0)] + [(cliff + s, cliff + s, 0, amount, 0) for s in steps]
+
+
+def exponential_decay_segments(tokens, spec):
+    tge = spec.get("tge", 0) / 100
+    cliff = spec.get("cliff", 0)
+    vesting_period = spec.get("vesting_period", 1)
+    decay = np.log(2) / spec.get("half_life", 12)
+    rate = tokens * (1 - tge) * decay / (1 - np.exp(-decay * vesting_period))
+    return [(0, 0, 0, tokens * tge, 0), (cliff, cliff + vesting_period, rate, 0, decay)]
+
+
+def milestone_segments(tokens, spec):
+    lumps = [(0, 0, 0, tokens * spec.get("tge", 0) / 100, 0)]
+    for milestone in spec.get("milestones", []):
+        if milestone["month"] > 0:
+            lumps.append((milestone["month"], milestone["month"], 0, tokens * milestone["percent"] / 100, 0))
+    return lumps
+
+
+def piecewise_segments(tokens, spec):
+    months, percents = np.asarray(spec["points"], dtype=float).T
+    segments = [(months[0], months[0], 0, tokens * percents[0] / 100, 0)]
+    for i in range(1, len(months)):
+        if months[i] > months[i - 1]:
+            rate = tokens * (percents[i] - percents[i - 1]) / 100 / (months[i] - months[i - 1])
+            segments.append((months[i - 1], months[i], rate, 0, 0))
+    return segments
+
+
+SEGMENT_BUILDERS = {
+    "linear": linear_segments,
+    "catch_up": catch_up_segments,
+    "fixed_rate": fixed_rate_segments,
+    "stepped": stepped_segments,
+    "exponential_decay": exponential_decay_segments,
+    "milestone": milestone_segments,
+    "piecewise": piecewise_segments,
+}
+
+
+# Function to compile the declared vesting curves into segment arrays (one row per schedule change)
+# per_bucket=True gives every vesting bucket (e.g. each private sale tier) its own owner row,
+# in expand_vesting_buckets order, instead of grouping buckets by category
+def compile_segments(allocations, vesting_schedule, private_sale_tiers=None, per_bucket=False):
+    categories = list(allocations.keys())
+    buckets = expand_vesting_buckets(allocations, vesting_schedule, private_sale_tiers)
+    rows, labels, owners = [], [], []
+    for index, (row, tokens, spec) in enumerate(buckets):
+        curve = spec.get("curve", "linear")
+        if curve not in SEGMENT_BUILDERS:
+            raise ValueError(f"Unknown vesting curve '{curve}'")
+        label = f"{categories[row]} ({spec['tier']})" if "tier" in spec else categories[row]
+        owners.append(label)
+        for segment in SEGMENT_BUILDERS[curve](tokens, spec):
+            if segment[2] != 0 or segment[3] != 0:
+                rows.append((index if per_bucket else row,) + segment)
+                labels.append(label)
+
+    owner, start, end, rate, lump, decay = (np.array(column, dtype=float) for column in zip(*rows)) if rows else [np.zeros(0)] * 6
+    return {
+        "categories": owners if per_bucket else categories,
+        "labels": labels,
+        "owner": owner.astype(np.int64),
+        "start": start,
+        "end": end,
+        "rate": rate,
+        "lump": lump,
+        "decay": decay,
+    }
+
+
+# Function to sum weighted step (t >= b) and ramp ((t - b)+) functions at the query times
+# Breakpoints are sorted once and read through prefix sums, so cost is O((times + breaks) log breaks)
+def sum_breakpoints(breaks, step_weights, ramp_weights, times):
+    order = np.argsort(breaks, kind="stable")
+    breaks = breaks[order]
+    steps = np.concatenate([[0], np.cumsum(step_weights[order])])
+    ramps = np.concatenate([[0], np.cumsum(ramp_weights[order])])
+    ramp_offsets = np.concatenate([[0], np.cumsum(ramp_weights[order] * breaks)])
+    index = np.searchsorted(breaks, times, side="right")
+    return steps[index] + times * ramps[index] - ramp_offsets[index]
+
+
+# Function to evaluate cumulative unlocked tokens per category at arbitrary times (closed form)
+def calculate_cumulative_unlocked(segments, times):
+    times = np.asarray(times, dtype=float)
+    cumulative = np.zeros((len(segments["categories"]), len(times)))
+    for owner in range(len(segments["categories"])):
+        mine = segments["owner"] == owner
+        start, end = segments["start"][mine], segments["end"][mine]
+        rate, lump, decay = segments["rate"][mine], segments["lump"][mine], segments["decay"][mine]
+        flat = decay == 0
+
+        # A flat segment is a ramp up at its start and an equal ramp down at its end
+        breaks = np.concatenate([start, start[flat], end[flat]])
+        step_weights = np.concatenate([lump, np.zeros(2 * flat.sum())])
+        ramp_weights = np.concatenate([np.zeros(len(start)), rate[flat], -rate[flat]])
+        cumulative[owner] = sum_breakpoints(breaks, step_weights, ramp_weights, times)
+
+        if (~flat).any():
+            # Decaying segments integrate rate * exp(-decay * t) over their elapsed part
+            elapsed = np.clip(times[:, None] - start[~flat], 0, end[~flat] - start[~flat])
+            cumulative[owner] += (rate[~flat] * -np.expm1(-decay[~flat] * elapsed) / decay[~flat]).sum(axis=1)
+    return cumulative
+
+
+# Function to query circulating supply (%) at arbitrary times without building a dense grid
+def calculate_circulating_at(segments, times, total_supply):
+    return calculate_cumulative_unlocked(segments, times).sum(axis=0) / total_supply * 100
+
+
+# Function to densify segments into a category x period unlock grid on request
+# resolution splits each month into that many periods (e.g. 30 for daily)
+def densify_segments(segments, months=48, resolution=1):
+    times = np.arange(months * resolution + 1) / resolution
+    return np.diff(calculate_cumulative_unlocked(segments, times), prepend=0, axis=1)
@@ -0,0 +1,20 @@
+import numpy as np
+
+from supply_engine import calculate_unlock_matrix, calculate_shock_series
+
+
+# Function to precompute each category's cumulative unlock curve per token of allocation
+# Unlocks scale linearly with allocation, so this only needs rebuilding when cliffs, periods or curves change
+def calculate_unlock_basis(allocations, vesting_schedule, private_sale_tiers=None, months=240):
+    unlock_matrix = calculate_unlock_matrix(allocations, vesting_schedule, private_sale_tiers, months)
+    tokens = np.array(list(allocations.values()), dtype=float)
+    basis = np.divide(unlock_matrix, tokens[:, None], out=np.zeros_like(unlock_matrix), where=tokens[:, None] > 0)
+    return np.cumsum(basis, axis=1)
+
+
+# Function to answer an allocation what-if with a single matrix-vector product
+# allocation_tokens follows the basis row order; horizon (months) truncates the precomputed curves
+def apply_allocation_what_if(cumulative_basis, allocation_tokens, total_supply, horizon=None):
+    columns = cumulative_basis.shape[1] if horizon is None else horizon + 1
+    supply = np.asarray(allocation_tokens, dtype=float) @ cumulative_basis[:, :columns] / total_supply * 100
+    return supply, calculate_shock_series(supply)